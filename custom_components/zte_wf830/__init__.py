@@ -1,15 +1,36 @@
 """The ZTE WF830 integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+import aiohttp
 
-from .api import ZteWf830ApiClient
-from .const import DOMAIN
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .api import AsyncZteWf830ApiClient
+from .const import (
+    CONF_EXTRA_SENSORS,
+    CONF_MAX_IN_FLIGHT_REQUESTS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DOMAIN,
+    SCHEMA_STORAGE_VERSION,
+)
+from .coordinator import ZteDeviceUpdateCoordinator
+from .discovery import DeviceSchema, async_discover
+from .fleet import FleetScheduler
+
+# FleetScheduler shared by all entries
+DATA_FLEET = f"{DOMAIN}_fleet"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,28 +49,121 @@ async def async_setup_entry(
     """Set up ZTE WF830 from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
+    fleet: FleetScheduler = hass.data.setdefault(DATA_FLEET, FleetScheduler())
+
+    max_in_flight = int(
+        entry.options.get(CONF_MAX_IN_FLIGHT_REQUESTS, DEFAULT_MAX_IN_FLIGHT_REQUESTS)
+    )
 
-    api_client = ZteWf830ApiClient(
+    # The shared session pools connections per host, and the client's request
+    # queue keeps at most max_in_flight of them busy for this router.
+    api_client = AsyncZteWf830ApiClient(
         host=entry.data["host"],
         smartadmin_password=entry.data["smartadmin_password"],
+        session=async_get_clientsession(hass),
+        max_in_flight=max_in_flight,
     )
 
     try:
         _LOGGER.info("Authenticating with ZTE WF830")
-        hass.async_add_executor_job(api_client.authenticate)
-    except Exception as err:
-        raise ConfigEntryAuthFailed from err
+        authenticated = await api_client.authenticate()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        raise ConfigEntryNotReady(f"Router is not reachable: {err}") from err
+    if not authenticated:
+        raise ConfigEntryAuthFailed("Invalid smartadmin password")
+
+    if entry.unique_id is None:
+        # the serial number identifies the device for every entity
+        try:
+            serial_number = await api_client.get_serial_number()
+        except Exception as err:
+            raise ConfigEntryNotReady(f"Reading serial number failed: {err}") from err
+        hass.config_entries.async_update_entry(entry, unique_id=serial_number)
+
+    store = _schema_store(hass, entry)
+    schema_data = await store.async_load()
+
+    coordinator = ZteDeviceUpdateCoordinator(
+        hass,
+        api_client,
+        min_poll_interval=entry.options.get(
+            CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+        ),
+        max_poll_interval=entry.options.get(
+            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+        ),
+        schema=DeviceSchema.from_dict(schema_data) if schema_data else None,
+        extra_sensors=entry.options.get(CONF_EXTRA_SENSORS, []),
+        fleet=fleet,
+    )
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    async def _async_stop(_: Event) -> None:
+        # entries stay loaded when Home Assistant stops, and the fleet's timers
+        # are not cancelled with Home Assistant's own
+        await coordinator.async_shutdown()
 
-    hass.data[DOMAIN][entry.entry_id] = api_client
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    )
+
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    # Entities are created from the entry alone and filled in once the first
+    # snapshot arrives, so a slow router does not hold up startup.
+    entry.async_create_background_task(
+        hass,
+        _async_first_refresh(coordinator, None if schema_data else store),
+        f"{DOMAIN} {entry.entry_id} first refresh",
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+def _schema_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, SCHEMA_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.schema")
+
+
+async def _async_first_refresh(
+    coordinator: ZteDeviceUpdateCoordinator, schema_store: Store | None
+) -> None:
+    """Fetch the first snapshot, then discover the schema if none is stored.
+
+    Discovery takes a few dozen requests, so it only starts once the entities
+    have their data.
+    """
+    await coordinator.async_refresh()
+
+    if schema_store is None:
+        return
+
+    try:
+        coordinator.schema = await async_discover(coordinator.api_client)
+    except Exception as err:  # pylint: disable=broad-except
+        # only the extra sensors depend on it; try again on the next setup
+        _LOGGER.warning("Discovering device nodes failed: %s", err)
+        return
+
+    await schema_store.async_save(coordinator.schema.as_dict())
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the discovered schema of a removed entry."""
+    await _schema_store(hass, entry).async_remove()
@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
 from enum import Enum
-from http.client import RemoteDisconnected
 import logging
+import math
 import time
 from xml.parsers.expat import ExpatError
 
-# pylint: disable=no-name-in-module
-from pydantic import BaseModel
-import requests
+import aiohttp
 import xmltodict
 
-from .const import CHANGE_BAND_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+from .const import (
+    CHANGE_BAND_TIMEOUT,
+    COALESCE_WINDOW,
+    DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+    REBOOT_PROBE_TIMEOUT,
+    SESSION_LIFETIME,
+    SESSION_REFRESH_MARGIN,
+)
+from .metrics import ClientMetrics
+from .request_queue import RequestPriority, RequestQueue
+from .retry import CircuitBreaker, DeviceUnavailableError, RetryPolicy
+from .xml_parser import parse_lists, parse_node_values
 
 PROTO: str = "http"
 TOKEN_COOKIE_NAME: str = "-goahead-session-"
@@ -21,7 +33,8 @@ TOKEN_COOKIE_NAME: str = "-goahead-session-"
 _LOGGER = logging.getLogger(__name__)
 
 
-class SignalParams(BaseModel):
+@dataclass(slots=True)
+class SignalParams:
     strength: int
     network_type: str
     rsrp0: int
@@ -32,7 +45,8 @@ class SignalParams(BaseModel):
     wan_ip_addr: str
 
 
-class TransferStatus(BaseModel):
+@dataclass(slots=True)
+class TransferStatus:
     # all in bytes
     current_download: int
     current_upload: int
@@ -41,23 +55,101 @@ class TransferStatus(BaseModel):
     total_upload: int
 
 
+# Every operating band E-UTRA defines (3GPP TS 36.101); 15 and 16 are reserved.
+E_UTRA_BANDS: tuple[int, ...] = (
+    *range(1, 15),
+    *range(17, 55),
+    *range(65, 77),
+    85,
+    87,
+    88,
+    103,
+    106,
+    107,
+    108,
+)
+
+
+def _encode_band(number: int) -> str:
+    return f"{number};".encode("utf-16-be").hex().upper()
+
+
 class LteBand(str, Enum):
-    BAND_1 = "0031003B"
-    BAND_3 = "0033003B"
-    BAND_7 = "0037003B"
-    BAND_20 = "00320030003B"
+    """LTE band, valued with its SET_ACTIVE_BANDS encoding.
+
+    The device expects the band list as UTF-16BE hex, each band number
+    followed by ``;``, so ``0031003B`` is ``1;``. A selection is written by
+    concatenating the values of its bands. There is a member for every band
+    in E_UTRA_BANDS, named ``BAND_<number>``.
+    """
+
+    _ignore_ = "LteBand band_number"
+    LteBand = vars()
+    for band_number in E_UTRA_BANDS:
+        LteBand[f"BAND_{band_number}"] = _encode_band(band_number)
+
+    @property
+    def number(self) -> int:
+        return _BAND_NUMBERS[self]
+
+    @property
+    def mask(self) -> int:
+        """Bit of this band in a band mask, bit ``n - 1`` for band ``n``."""
+        return 1 << (_BAND_NUMBERS[self] - 1)
+
+    @classmethod
+    def to_mask(cls, bands: Iterable[LteBand]) -> int:
+        mask = 0
+        for band in bands:
+            mask |= band.mask
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> list[LteBand]:
+        """Bands set in ``mask``, in ascending band order."""
+        bands = []
+        while mask:
+            number = (mask & -mask).bit_length()
+            bands.append(_BANDS_BY_NUMBER[number])
+            mask &= mask - 1
+        return bands
+
+    @classmethod
+    def encode(cls, bands: Iterable[LteBand]) -> str:
+        """SET_ACTIVE_BANDS value selecting exactly ``bands``."""
+        return "".join(band.value for band in cls.from_mask(cls.to_mask(bands)))
+
+    @classmethod
+    def decode(cls, value: str) -> list[LteBand]:
+        """Bands of a GET_ACTIVE_BANDS value such as ``1;3;20;``.
+
+        Numbers that are not E-UTRA bands are left out and logged once.
+        """
+        bands = []
+        for token in value.split(";"):
+            if (band := _BANDS_BY_TOKEN.get(token)) is not None:
+                bands.append(band)
+            elif token and token not in _UNKNOWN_BAND_TOKENS:
+                _UNKNOWN_BAND_TOKENS.add(token)
+                _LOGGER.warning("Ignoring unknown band %s reported by device", token)
+        return bands
 
     @classmethod
     def get_from_band_index(cls, band_index: int) -> LteBand:
-        if band_index == 1:
-            return cls.BAND_1
-        if band_index == 3:
-            return cls.BAND_3
-        if band_index == 7:
-            return cls.BAND_7
-        if band_index == 20:
-            return cls.BAND_20
-        raise ValueError(f"Invalid band index: {band_index}.")
+        if (band := _BANDS_BY_NUMBER.get(band_index)) is None:
+            raise ValueError(f"Invalid band index: {band_index}.")
+        return band
+
+
+_BANDS_BY_NUMBER: dict[int, LteBand] = dict(zip(E_UTRA_BANDS, LteBand))
+_BAND_NUMBERS: dict[LteBand, int] = {
+    band: number for number, band in _BANDS_BY_NUMBER.items()
+}
+# decoding looks up the band number as it appears between the semicolons
+_BANDS_BY_TOKEN: dict[str, LteBand] = {
+    str(number): band for number, band in _BANDS_BY_NUMBER.items()
+}
+_UNKNOWN_BAND_TOKENS: set[str] = set()
 
 
 class ZteNode(str, Enum):
@@ -82,6 +174,18 @@ class ZteNode(str, Enum):
     SET_REBOOT2 = "N_5_67"
 
 
+# Any node id. The ZteNode members are the nodes the integration itself uses;
+# others come from discovery.
+NodeId = str
+
+# How long a fetched value may be served from cache, in seconds. Nodes missing
+# here are always read from the device.
+DEFAULT_NODE_TTL: dict[ZteNode, float] = {
+    ZteNode.GET_SERIAL_NUMBER: math.inf,
+    ZteNode.GET_WAN_IP_ADDR: 300,
+}
+
+
 class ZteCommands(str, Enum):
     NODE_GET = "OAM_MIDWARE_NODE_GET"
     NODEM_SET = "OAM_MIDWARE_NODEM_SET"
@@ -90,166 +194,656 @@ class ZteCommands(str, Enum):
     LIST_FULL = "OAM_MIDWARE_LIST_FULL"
 
 
-def _api_wprapper(func: Callable):
-    def wrap(*args, **kwargs):
-        self: ZteWf830ApiClient = args[0]
-
-        while True:
-            try:
-                return func(*args, **kwargs)
-            except ExpatError:
-                self.authenticate()
-            except requests.exceptions.ConnectionError as err:
-                if not isinstance(err.args[0].args[1], RemoteDisconnected):
-                    raise err
-                time.sleep(0.1)
-            except requests.exceptions.ReadTimeout:
-                time.sleep(0.1)
+# LIST_FULL list whose first entry holds the cumulative transfer counters
+TRANSFER_LIST = 0
+
+
+@dataclass(slots=True)
+class DeviceSnapshot:
+    signal_params: SignalParams
+    transfer_status: TransferStatus
+    active_bands: list[LteBand]
+
+
+SIGNAL_PARAMS_NODES: list[ZteNode] = [
+    ZteNode.GET_SIGNAL_STRENGTH,
+    ZteNode.GET_NETWORK_TYPE,
+    ZteNode.GET_RSRP0,
+    ZteNode.GET_RSRP1,
+    ZteNode.GET_RSRQ,
+    ZteNode.GET_SINR,
+    ZteNode.GET_NETWORK_STATUS,
+    ZteNode.GET_WAN_IP_ADDR,
+]
+CURRENT_TRANSFER_NODES: list[ZteNode] = [
+    ZteNode.GET_CURRENT_DOWNLOAD,
+    ZteNode.GET_CURRENT_UPLOAD,
+]
+SNAPSHOT_NODES: list[ZteNode] = [
+    *SIGNAL_PARAMS_NODES,
+    *CURRENT_TRANSFER_NODES,
+    ZteNode.GET_ACTIVE_BANDS,
+]
+
+
+def parse_signal_params(values: dict[ZteNode, str]) -> SignalParams:
+    return SignalParams(
+        strength=int(values[ZteNode.GET_SIGNAL_STRENGTH]),
+        network_type=values[ZteNode.GET_NETWORK_TYPE],
+        rsrp0=int(values[ZteNode.GET_RSRP0]),
+        rsrp1=int(values[ZteNode.GET_RSRP1]),
+        rsrq=int(values[ZteNode.GET_RSRQ]),
+        sinr=int(values[ZteNode.GET_SINR]),
+        network_status=values[ZteNode.GET_NETWORK_STATUS],
+        wan_ip_addr=values[ZteNode.GET_WAN_IP_ADDR],
+    )
+
+
+def _parse_transfer_status(
+    values: dict[ZteNode, str], lists: dict[int, list[dict[str, str]]]
+) -> TransferStatus:
+    transfer_list = lists[TRANSFER_LIST][0]
+
+    return TransferStatus(
+        current_download=int(values[ZteNode.GET_CURRENT_DOWNLOAD]),
+        current_upload=int(values[ZteNode.GET_CURRENT_UPLOAD]),
+        total_download=int(transfer_list["L_1"]),
+        total_upload=int(transfer_list["L_5"]),
+    )
+
+
+def parse_active_bands(value: str) -> list[LteBand]:
+    return LteBand.decode(value)
+
+
+def parse_snapshot(
+    values: dict[ZteNode, str], lists: dict[int, list[dict[str, str]]]
+) -> DeviceSnapshot:
+    """Build a snapshot from SNAPSHOT_NODES values and the TRANSFER_LIST."""
+    return DeviceSnapshot(
+        signal_params=parse_signal_params(values),
+        transfer_status=_parse_transfer_status(values, lists),
+        active_bands=parse_active_bands(values[ZteNode.GET_ACTIVE_BANDS]),
+    )
+
+
+class NodeBatch:
+    """Nodes requested by several consumers, fetched together.
+
+    Every consumer adds the nodes it needs, duplicates are merged, and the
+    client reads all of them with a single NODE_GET. Lists are read with one
+    LIST_FULL each, sent concurrently with it.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[NodeId, None] = {}
+        self.lists: dict[int, None] = {}
+
+    def add(self, nodes: Iterable[NodeId]) -> NodeBatch:
+        self.nodes.update(dict.fromkeys(nodes))
+        return self
+
+    def add_lists(self, list_ids: Iterable[int]) -> NodeBatch:
+        self.lists.update(dict.fromkeys(list_ids))
+        return self
+
+    def add_transfer_list(self) -> NodeBatch:
+        return self.add_lists([TRANSFER_LIST])
+
+
+class _NodeGetCoalescer:
+    """Single-flight layer merging concurrent NODE_GET requests.
+
+    Nodes requested within ``window`` seconds of each other are fetched with
+    one request and every caller gets its own subset of the result. A caller
+    whose nodes are all covered by a request already in flight joins it
+    instead of queueing a new one.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[NodeId]], Awaitable[dict[NodeId, str]]],
+        window: float,
+    ) -> None:
+        self._fetch = fetch
+        self._window = window
+
+        self._pending: dict[NodeId, None] = {}
+        self._pending_future: asyncio.Future[dict[NodeId, str]] | None = None
+        self._in_flight: dict[asyncio.Task, frozenset[NodeId]] = {}
+
+    async def get(self, nodes: Iterable[NodeId]) -> dict[NodeId, str]:
+        nodes = list(dict.fromkeys(nodes))
+
+        future = self._find_in_flight(nodes) or self._enqueue(nodes)
+        values = await asyncio.shield(future)
+
+        return {node: values[node] for node in nodes}
+
+    def _find_in_flight(
+        self, nodes: list[NodeId]
+    ) -> asyncio.Future[dict[NodeId, str]] | None:
+        for task, in_flight_nodes in self._in_flight.items():
+            if in_flight_nodes.issuperset(nodes):
+                return task
+        return None
+
+    def _enqueue(self, nodes: list[NodeId]) -> asyncio.Future[dict[NodeId, str]]:
+        if self._pending_future is None:
+            loop = asyncio.get_running_loop()
+            self._pending_future = loop.create_future()
+            loop.call_later(self._window, self._flush)
 
-    return wrap
+        self._pending.update(dict.fromkeys(nodes))
+
+        return self._pending_future
+
+    def _flush(self) -> None:
+        nodes = list(self._pending)
+        future = self._pending_future
+        assert future is not None
+
+        self._pending = {}
+        self._pending_future = None
+
+        task = asyncio.create_task(self._fetch(nodes))
+        self._in_flight[task] = frozenset(nodes)
+
+        def _resolve(task: asyncio.Task) -> None:
+            del self._in_flight[task]
+            if task.cancelled():
+                future.cancel()
+            elif (err := task.exception()) is not None:
+                future.set_exception(err)
+                # every caller may have been cancelled in the meantime
+                future.exception()
+            else:
+                future.set_result(task.result())
+
+        task.add_done_callback(_resolve)
 
 
-class ZteWf830ApiClient:
-    """ """
+class _OneShotConnector(aiohttp.TCPConnector):
+    """Opens a single connection, for requests that must be sent only once.
 
-    session: requests.Session
+    aiohttp sends an idempotent request again on a new connection when the
+    first one is dropped. The second connection is refused here, as if the
+    device had dropped it too.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(force_close=True)
+        self._connected = False
 
-    def __init__(self, host: str, smartadmin_password: str) -> None:
+    async def connect(
+        self,
+        req: aiohttp.ClientRequest,
+        traces: list[aiohttp.tracing.Trace],
+        timeout: aiohttp.ClientTimeout,
+    ) -> aiohttp.connector.Connection:
+        if self._connected:
+            raise aiohttp.ServerDisconnectedError("Connection already used")
+        self._connected = True
+        return await super().connect(req, traces, timeout)
+
+
+def _api_wprapper(func: Callable):
+    """Retry a call according to the client's retry policy.
+
+    A response that is not XML means the session expired, so it is marked
+    stale and the retry logs in again first. Dropped connections and timeouts
+    are retried with backoff. Once the attempts are used up, or the connection is
+    refused outright, the failure is reported to the circuit breaker.
+
+    Attempts are counted as requests sent to the device. aiohttp resends a GET
+    once by itself when its connection is dropped, so a disconnect that gets
+    here has already cost two.
+    """
+
+    async def wrap(*args, **kwargs):
+        self: AsyncZteWf830ApiClient = args[0]
+        breaker = self.circuit_breaker
+
+        trial = breaker.before_call()
+
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    await self._ensure_session()
+                    generation = self._session_generation
+                    result = await func(*args, **kwargs)
+                except ExpatError as err:
+                    self.metrics.expired_sessions += 1
+                    error: Exception = err
+                except aiohttp.ServerDisconnectedError as err:
+                    attempt += 1
+                    error = err
+                except asyncio.TimeoutError as err:
+                    error = err
+                except aiohttp.ClientConnectionError:
+                    breaker.record_failure()
+                    raise
+                else:
+                    breaker.record_success()
+                    return result
+
+                if attempt >= self.retry_policy.max_attempts:
+                    breaker.record_failure()
+                    raise DeviceUnavailableError(
+                        f"{func.__name__} failed after {attempt} attempts: {error!r}"
+                    ) from error
+
+                self.metrics.record_retry(func.__name__.lstrip("_"))
+                if isinstance(error, ExpatError):
+                    self._expire_session(generation)
+                else:
+                    await asyncio.sleep(self.retry_policy.delay(attempt))
+        finally:
+            if trial:
+                # cancelled, or failed in a way not handled above
+                breaker.end_trial()
+
+    return wrap
+
+
+class AsyncZteWf830ApiClient:
+    """Asyncio client for the WF830 web interface.
+
+    Requests go through the given aiohttp session, Home Assistant's shared
+    one in the integration, which pools connections per host and keeps them
+    alive between polls. The goahead session token is tracked by the client
+    itself and sent explicitly, because the shared cookie jar refuses cookies
+    set by bare IP hosts.
+
+    The router drops sessions that stay idle for ``session_lifetime`` seconds.
+    The client logs in again shortly before that happens instead of waiting
+    for a failed request, and only one login runs at a time.
+
+    All requests to the device pass through ``request_queue``, which keeps at
+    most ``max_in_flight`` of them in flight. Logins and writes are sent ahead
+    of waiting polls.
+
+    Every request is recorded in ``metrics``.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        smartadmin_password: str,
+        session: aiohttp.ClientSession,
+        coalesce_window: float = COALESCE_WINDOW,
+        node_ttl: Mapping[NodeId, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        session_lifetime: float = SESSION_LIFETIME,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+    ) -> None:
         self.host = host
         self.smartadmin_password = smartadmin_password
+        self.session = session
+
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        self.session_lifetime = session_lifetime
+        self.metrics = ClientMetrics()
+        self.request_queue = RequestQueue(max_in_flight, self.metrics)
 
-    def authenticate(self) -> bool:
-        self.session = requests.Session()
+        self._token: str | None = None
+        self._session_expires_at = 0.0
+        self._session_generation = 0
+        self._login_lock = asyncio.Lock()
 
-        response = self.session.post(
+        self._node_get = _NodeGetCoalescer(self._get_node_values, coalesce_window)
+
+        self._node_ttl = {**DEFAULT_NODE_TTL, **(node_ttl or {})}
+        self._node_cache: dict[NodeId, tuple[float, str]] = {}
+
+    async def authenticate(self) -> bool:
+        async with self._login_lock:
+            return await self._login()
+
+    async def _ensure_session(self) -> None:
+        """Log in unless the current session is still fresh."""
+        if time.monotonic() < self._session_expires_at:
+            return
+
+        generation = self._session_generation
+        async with self._login_lock:
+            # another caller may have logged in while we waited for the lock
+            if generation == self._session_generation:
+                await self._login()
+
+    def _expire_session(self, generation: int) -> None:
+        """Mark the session stale, unless it was already replaced."""
+        if generation == self._session_generation:
+            self._session_expires_at = 0.0
+
+    def _touch_session(self) -> None:
+        self._session_expires_at = (
+            time.monotonic() + self.session_lifetime - SESSION_REFRESH_MARGIN
+        )
+
+    async def _login(self) -> bool:
+        return await self.request_queue.submit(
+            self._send_login, RequestPriority.LOGIN
+        )
+
+    async def _send_login(self) -> bool:
+        started = time.perf_counter()
+        async with self.session.post(
             url=f"{PROTO}://{self.host}/action/login",
             data={
                 "username": "smartadmin",
                 "password": self.smartadmin_password,
             },
-            timeout=DEFAULT_REQUEST_TIMEOUT,
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+        ) as response:
+            content = await response.text()
+
+            for hop in (*response.history, response):
+                if TOKEN_COOKIE_NAME in hop.cookies:
+                    self._token = hop.cookies[TOKEN_COOKIE_NAME].value
+
+        authenticated = not "errString" in content
+        self.metrics.record_login(
+            time.perf_counter() - started, len(content), authenticated
         )
 
-        return not "errString" in response.content.decode()
+        self._session_generation += 1
+        if authenticated:
+            self._touch_session()
+        else:
+            self._session_expires_at = 0.0
+
+        return authenticated
+
+    async def _request(
+        self,
+        params: dict[str, str],
+        timeout: float,
+        priority: RequestPriority = RequestPriority.POLL,
+        once: bool = False,
+        record_nodes: bool = True,
+    ) -> bytes:
+        """Queue a request and return the response body.
+
+        Identical polls waiting in the queue are sent once. With ``once`` set,
+        the request goes out on its own connection and is not resent by
+        aiohttp when that connection drops. Without ``record_nodes``, its
+        latency is not recorded for each node it reads.
+        """
+        return await self.request_queue.submit(
+            lambda: self._send_request(params, timeout, once, record_nodes),
+            priority,
+            key=tuple(params.items()) if priority is RequestPriority.POLL else None,
+        )
+
+    async def _send_request(
+        self,
+        params: dict[str, str],
+        timeout: float,
+        once: bool = False,
+        record_nodes: bool = True,
+    ) -> bytes:
+        headers = {}
+        if self._token is not None:
+            headers["Cookie"] = f"{TOKEN_COOKIE_NAME}={self._token}"
+
+        url = f"{PROTO}://{self.host}/_request.xml"
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        if once:
+            request = aiohttp.request(
+                "GET",
+                url,
+                params=params,
+                headers=headers,
+                timeout=client_timeout,
+                connector=_OneShotConnector(),
+            )
+        else:
+            request = self.session.get(
+                url, params=params, headers=headers, timeout=client_timeout
+            )
+
+        command = params["cmd"]
+        started = time.perf_counter()
+        try:
+            async with request as response:
+                content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record_error(command)
+            raise
+
+        self.metrics.record_request(
+            command,
+            params["node"].split(";") if record_nodes and "node" in params else (),
+            time.perf_counter() - started,
+            len(content),
+        )
+        self._touch_session()
+
+        return content
 
     @_api_wprapper
-    def set_band(self, band: LteBand) -> str:
-        response = self.session.get(
-            url=f"{PROTO}://{self.host}/_request.xml",
-            params={
-                "cmd": ZteCommands.NODEM_SET,
-                "node": ZteNode.SET_ACTIVE_BANDS,
-                "value": ";".join([band]),
+    async def set_bands(self, bands: Iterable[LteBand]) -> str:
+        """Enable exactly ``bands`` with a single write."""
+        content = await self._request(
+            {
+                "cmd": ZteCommands.NODEM_SET.value,
+                "node": ZteNode.SET_ACTIVE_BANDS.value,
+                "value": LteBand.encode(bands),
             },
             timeout=CHANGE_BAND_TIMEOUT,
+            priority=RequestPriority.WRITE,
         )
 
-        xml_response = xmltodict.parse(response.content)
+        started = time.perf_counter()
+        xml_response = xmltodict.parse(content)
+        self.metrics.record_parse(
+            ZteCommands.NODEM_SET.value, time.perf_counter() - started
+        )
 
         return xml_response["data"]["result"]
 
+    async def set_band(self, band: LteBand) -> str:
+        return await self.set_bands([band])
+
+    async def get_node_values(
+        self, nodes: Iterable[NodeId], record_nodes: bool = True
+    ) -> dict[NodeId, str]:
+        """Values of ``nodes``, from the cache where it is still fresh.
+
+        Concurrent reads are merged into one request. Reads with
+        ``record_nodes`` off, such as discovery probing every node id, are
+        sent on their own and not broken down by node in the metrics.
+        """
+        now = time.monotonic()
+        values: dict[NodeId, str] = {}
+        missing: list[NodeId] = []
+
+        for node in dict.fromkeys(nodes):
+            cached = self._node_cache.get(node)
+            if cached is not None and cached[0] > now:
+                values[node] = cached[1]
+            else:
+                missing.append(node)
+
+        if missing:
+            if record_nodes:
+                fetched = await self._node_get.get(missing)
+            else:
+                fetched = await self._get_node_values(missing, record_nodes=False)
+            now = time.monotonic()
+            for node, value in fetched.items():
+                if (ttl := self._node_ttl.get(node, 0)) > 0:
+                    self._node_cache[node] = (now + ttl, value)
+            values.update(fetched)
+
+        return values
+
+    def invalidate_cache(self, nodes: Iterable[NodeId] | None = None) -> None:
+        """Drop cached values so the next read goes to the device."""
+        if nodes is None:
+            self._node_cache.clear()
+            return
+        for node in nodes:
+            self._node_cache.pop(node, None)
+
     @_api_wprapper
-    def get_node_value(self, nodes: list[ZteNode]) -> list[str]:
-        response = self.session.get(
-            url=f"{PROTO}://{self.host}/_request.xml",
-            params={
-                "cmd": ZteCommands.NODE_GET,
+    async def _get_node_values(
+        self, nodes: list[NodeId], record_nodes: bool = True
+    ) -> dict[NodeId, str]:
+        content = await self._request(
+            {
+                "cmd": ZteCommands.NODE_GET.value,
                 "node": ";".join(nodes),
             },
             timeout=DEFAULT_REQUEST_TIMEOUT,
+            record_nodes=record_nodes,
         )
 
-        xml_response = xmltodict.parse(response.content)
+        started = time.perf_counter()
+        tag_values = parse_node_values(content)
+        self.metrics.record_parse(
+            ZteCommands.NODE_GET.value, time.perf_counter() - started
+        )
 
-        return [tag_value.strip(";") for tag_value in xml_response["data"].values()]
+        # nodes the firmware does not know come back empty or not at all
+        return {node: tag_values.get(node, "") for node in nodes}
 
-    def get_active_bands(self) -> list[LteBand]:
-        (value,) = self.get_node_value([ZteNode.GET_ACTIVE_BANDS])
-        bands = value.strip(";").split(";")
+    async def get_node_value(self, nodes: list[NodeId]) -> list[str]:
+        values = await self.get_node_values(nodes)
 
-        return [LteBand.get_from_band_index(int(band)) for band in bands]
+        return [values[node] for node in nodes]
 
-    @_api_wprapper
-    def reboot(self) -> None:
-        self.session.get(
-            url=f"{PROTO}://{self.host}/_request.xml",
-            params={
-                "cmd": ZteCommands.NODE_SET,
-                "node": ZteNode.SET_REBOOT1,
-                "value": "1",
-            },
-            timeout=DEFAULT_REQUEST_TIMEOUT,
+    async def fetch(
+        self, batch: NodeBatch, record_nodes: bool = True
+    ) -> tuple[dict[NodeId, str], dict[int, list[dict[str, str]]]]:
+        """Read a batch with one NODE_GET plus one LIST_FULL per list.
+
+        All requests are in flight at the same time, so the batch costs the
+        latency of a single round-trip. Lists are returned by their id.
+        ``record_nodes`` is passed on to ``get_node_values``.
+        """
+        list_ids = list(batch.lists)
+        values, *lists = await asyncio.gather(
+            self.get_node_values(batch.nodes, record_nodes=record_nodes),
+            *(self.get_list(list_id) for list_id in list_ids),
         )
-        self.session.get(
-            url=f"{PROTO}://{self.host}/_request.xml",
-            params={
-                "cmd": ZteCommands.NODE_SET,
-                "node": ZteNode.SET_REBOOT2,
+
+        return values, dict(zip(list_ids, lists))
+
+    async def get_active_bands(self) -> list[LteBand]:
+        (value,) = await self.get_node_value([ZteNode.GET_ACTIVE_BANDS])
+
+        return parse_active_bands(value)
+
+    async def reboot(self) -> None:
+        """Reboot the device.
+
+        Not retried, by the client or by aiohttp: a repeated write could reach
+        the device while it boots. The device may go down before answering the
+        second write, so a connection dropped or timed out there counts as
+        success.
+        """
+        await self._ensure_session()
+        self.invalidate_cache([ZteNode.GET_WAN_IP_ADDR])
+        await self._request(
+            {
+                "cmd": ZteCommands.NODE_SET.value,
+                "node": ZteNode.SET_REBOOT1.value,
                 "value": "1",
             },
             timeout=DEFAULT_REQUEST_TIMEOUT,
+            priority=RequestPriority.WRITE,
+            once=True,
         )
+        try:
+            await self._request(
+                {
+                    "cmd": ZteCommands.NODE_SET.value,
+                    "node": ZteNode.SET_REBOOT2.value,
+                    "value": "1",
+                },
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                priority=RequestPriority.WRITE,
+                once=True,
+            )
+        except aiohttp.ClientConnectorError:
+            # never reached the device
+            raise
+        except (
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+        ) as err:
+            _LOGGER.debug("Device went down while acknowledging the reboot: %r", err)
+
+    async def probe(self) -> bool:
+        """Whether the web server answers at all, without logging in.
+
+        Bypasses retries and the circuit breaker, and aiohttp does not resend
+        it either, so it is cheap to call while the device is known to be down.
+        """
+        try:
+            await self.request_queue.submit(self._send_probe, key="probe")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+        return True
+
+    async def _send_probe(self) -> None:
+        async with aiohttp.request(
+            "GET",
+            f"{PROTO}://{self.host}/",
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(total=REBOOT_PROBE_TIMEOUT),
+            connector=_OneShotConnector(),
+        ) as response:
+            await response.read()
 
     @_api_wprapper
-    def get_transfer_status(self):
-        response = self.session.get(
-            url=f"{PROTO}://{self.host}/_request.xml",
-            params={
-                "cmd": ZteCommands.LIST_FULL,
-                "list": "0",
+    async def get_list(self, list_id: int) -> list[dict[str, str]]:
+        """Entries of a LIST_FULL list, empty if the list does not exist."""
+        content = await self._request(
+            {
+                "cmd": ZteCommands.LIST_FULL.value,
+                "list": str(list_id),
             },
             timeout=DEFAULT_REQUEST_TIMEOUT,
         )
 
-        xml_response = xmltodict.parse(response.content)
-
-        [current_download, current_upload] = self.get_node_value(
-            [ZteNode.GET_CURRENT_DOWNLOAD, ZteNode.GET_CURRENT_UPLOAD]
+        started = time.perf_counter()
+        lists = parse_lists(content)
+        self.metrics.record_parse(
+            ZteCommands.LIST_FULL.value, time.perf_counter() - started
         )
 
-        return TransferStatus(
-            current_download=int(current_download),
-            current_upload=int(current_upload),
-            total_download=xml_response["data"]["list"][0]["L_1"],
-            total_upload=xml_response["data"]["list"][0]["L_5"],
-        )
+        return lists
 
-    def get_signal_params(self) -> SignalParams:
-        node_values = self.get_node_value(
-            [
-                ZteNode.GET_SIGNAL_STRENGTH,
-                ZteNode.GET_NETWORK_TYPE,
-                ZteNode.GET_RSRP0,
-                ZteNode.GET_RSRP1,
-                ZteNode.GET_RSRQ,
-                ZteNode.GET_SINR,
-                ZteNode.GET_NETWORK_STATUS,
-                ZteNode.GET_WAN_IP_ADDR,
-            ]
+    async def get_transfer_status(self) -> TransferStatus:
+        values, lists = await self.fetch(
+            NodeBatch().add(CURRENT_TRANSFER_NODES).add_transfer_list()
         )
-        (
-            signal_strength,
-            network_type,
-            rsrp0,
-            rsrp1,
-            rsrq,
-            sinr,
-            network_status,
-            wan_ip_addr,
-        ) = (value.strip(";") for value in node_values)
-
-        return SignalParams(
-            strength=int(signal_strength),
-            network_type=network_type,
-            rsrp0=int(rsrp0),
-            rsrp1=int(rsrp1),
-            rsrq=int(rsrq),
-            sinr=int(sinr),
-            network_status=network_status,
-            wan_ip_addr=wan_ip_addr,
+
+        return _parse_transfer_status(values, lists)
+
+    async def get_signal_params(self) -> SignalParams:
+        values = await self.get_node_values(SIGNAL_PARAMS_NODES)
+
+        return parse_signal_params(values)
+
+    async def get_snapshot(self) -> DeviceSnapshot:
+        """Fetch everything the platforms show in a single round-trip."""
+        values, lists = await self.fetch(
+            NodeBatch().add(SNAPSHOT_NODES).add_transfer_list()
         )
 
-    def get_serial_number(self) -> str:
-        (serial_number,) = self.get_node_value([ZteNode.GET_SERIAL_NUMBER])
+        return parse_snapshot(values, lists)
+
+    async def get_serial_number(self) -> str:
+        (serial_number,) = await self.get_node_value([ZteNode.GET_SERIAL_NUMBER])
 
         return serial_number
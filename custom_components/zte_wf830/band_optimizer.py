@@ -0,0 +1,193 @@
+"""Benchmarks every LTE band and pins the best one."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+import time
+
+from .api import (
+    SIGNAL_PARAMS_NODES,
+    TRANSFER_LIST,
+    AsyncZteWf830ApiClient,
+    LteBand,
+    NodeBatch,
+    ZteNode,
+    parse_active_bands,
+    parse_signal_params,
+)
+from .const import BAND_SAMPLE_COUNT, BAND_SAMPLE_INTERVAL, BAND_SETTLE_TIME
+
+_LOGGER = logging.getLogger(__name__)
+
+# (worst, best) values mapped onto 0..1 when scoring
+SINR_RANGE = (-10.0, 30.0)
+RSRQ_RANGE = (-20.0, -3.0)
+RSRP_RANGE = (-120.0, -70.0)
+
+SINR_WEIGHT = 0.4
+RSRQ_WEIGHT = 0.25
+RSRP_WEIGHT = 0.15
+# Measured throughput depends on what the network is used for at the time,
+# so it only nudges the radio-based score.
+THROUGHPUT_WEIGHT = 0.2
+
+
+@dataclass(slots=True)
+class BandMeasurement:
+    band: LteBand
+    sinr: float
+    rsrq: float
+    rsrp: float
+    # bytes/s, download and upload combined
+    throughput: float
+    score: float = 0.0
+
+
+def _normalize(value: float, value_range: tuple[float, float]) -> float:
+    worst, best = value_range
+    return min(1.0, max(0.0, (value - worst) / (best - worst)))
+
+
+def score_measurements(measurements: list[BandMeasurement]) -> None:
+    """Fill in the score of every measurement, higher is better."""
+    best_throughput = max((m.throughput for m in measurements), default=0.0)
+
+    for measurement in measurements:
+        throughput = (
+            measurement.throughput / best_throughput if best_throughput else 0.0
+        )
+        measurement.score = (
+            SINR_WEIGHT * _normalize(measurement.sinr, SINR_RANGE)
+            + RSRQ_WEIGHT * _normalize(measurement.rsrq, RSRQ_RANGE)
+            + RSRP_WEIGHT * _normalize(measurement.rsrp, RSRP_RANGE)
+            + THROUGHPUT_WEIGHT * throughput
+        )
+
+
+class BandOptimizer:
+    """Switches through the candidate bands, measures each and pins the best.
+
+    For every band the modem is given ``settle_time`` seconds to re-attach,
+    then SINR, RSRQ and RSRP are sampled ``sample_count`` times together with
+    the transfer counters. Bands on which the modem does not come back are
+    skipped. Unless a band was pinned, because none could be measured or the
+    run was cancelled, the original selection is restored.
+
+    Writes are made while holding ``band_lock``, the lock that serialises
+    every band change for the device, so a change requested meanwhile is
+    applied after the run instead of being overwritten by it.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncZteWf830ApiClient,
+        settle_time: float = BAND_SETTLE_TIME,
+        sample_count: int = BAND_SAMPLE_COUNT,
+        sample_interval: float = BAND_SAMPLE_INTERVAL,
+        band_lock: asyncio.Lock | None = None,
+    ) -> None:
+        self.api_client = api_client
+        self.band_lock = band_lock or asyncio.Lock()
+        self.settle_time = settle_time
+        self.sample_count = sample_count
+        self.sample_interval = sample_interval
+
+        self.last_results: list[BandMeasurement] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    async def async_optimize(self, bands: Iterable[LteBand]) -> LteBand | None:
+        """Benchmark ``bands`` and pin the best one, which is returned."""
+        async with self._lock, self.band_lock:
+            original_bands = await self.api_client.get_active_bands()
+            pinned: LteBand | None = None
+
+            try:
+                measurements = []
+                for band in bands:
+                    try:
+                        measurements.append(await self._async_measure(band))
+                    except Exception as err:  # pylint: disable=broad-except
+                        _LOGGER.warning("Could not measure %s: %s", band.name, err)
+
+                score_measurements(measurements)
+                self.last_results = measurements
+
+                if not measurements:
+                    _LOGGER.warning("No band could be measured")
+                    return None
+
+                best = max(measurements, key=lambda measurement: measurement.score)
+                _LOGGER.info(
+                    "Band scores: %s, pinning %s",
+                    ", ".join(f"{m.band.name}={m.score:.2f}" for m in measurements),
+                    best.band.name,
+                )
+                await self.api_client.set_band(best.band)
+                pinned = best.band
+
+                return pinned
+            finally:
+                if pinned is None:
+                    await self._async_restore(original_bands)
+
+    async def _async_restore(self, bands: list[LteBand]) -> None:
+        _LOGGER.info("Restoring bands %s", [band.name for band in bands])
+        try:
+            await self.api_client.set_bands(bands)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not restore the band selection: %s", err)
+
+    async def _async_measure(self, band: LteBand) -> BandMeasurement:
+        await self.api_client.set_band(band)
+        await asyncio.sleep(self.settle_time)
+
+        batch = (
+            NodeBatch()
+            .add(SIGNAL_PARAMS_NODES)
+            .add([ZteNode.GET_ACTIVE_BANDS])
+            .add_transfer_list()
+        )
+        sinr = rsrq = rsrp = 0.0
+        first_total: tuple[float, int] | None = None
+        last_total: tuple[float, int] = (0.0, 0)
+
+        for sample in range(self.sample_count):
+            if sample:
+                await asyncio.sleep(self.sample_interval)
+
+            values, lists = await self.api_client.fetch(batch)
+            transfer_list = lists[TRANSFER_LIST][0]
+            if band not in parse_active_bands(values[ZteNode.GET_ACTIVE_BANDS]):
+                raise RuntimeError("band was not applied")
+
+            signal_params = parse_signal_params(values)
+            sinr += signal_params.sinr
+            rsrq += signal_params.rsrq
+            rsrp += max(signal_params.rsrp0, signal_params.rsrp1)
+
+            last_total = (
+                time.monotonic(),
+                int(transfer_list["L_1"]) + int(transfer_list["L_5"]),
+            )
+            first_total = first_total or last_total
+
+        assert first_total is not None
+        elapsed = last_total[0] - first_total[0]
+        throughput = (
+            max(0, last_total[1] - first_total[1]) / elapsed if elapsed else 0.0
+        )
+
+        return BandMeasurement(
+            band=band,
+            sinr=sinr / self.sample_count,
+            rsrq=rsrq / self.sample_count,
+            rsrp=rsrp / self.sample_count,
+            throughput=throughput,
+        )
@@ -0,0 +1,362 @@
+"""Standalone collector serving the router's values as OpenMetrics.
+
+Polls the WF830 with the integration's API client and serves the latest
+snapshot on ``/metrics`` for Prometheus, without Home Assistant:
+
+    python custom_components/zte_wf830/collector.py --host 192.168.0.1
+
+It has to be run by its path like this. ``python -m
+custom_components.zte_wf830.collector`` imports the integration's package
+first, and with it Home Assistant.
+
+The password is read from ``--password`` or the ``ZTE_WF830_PASSWORD``
+environment variable.
+"""
+
+from __future__ import annotations
+
+if not __package__:
+    # Run as a script. Import the modules below through a bare package, so
+    # the package's __init__, which sets up the Home Assistant integration,
+    # never runs (PEP 366).
+    import pathlib
+    import sys
+    import types
+
+    _package_dir = pathlib.Path(__file__).resolve().parent
+    if str(_package_dir) in sys.path:
+        sys.path.remove(str(_package_dir))
+    for _name, _path in (
+        ("custom_components", _package_dir.parent),
+        ("custom_components.zte_wf830", _package_dir),
+    ):
+        if _name not in sys.modules:
+            _module = types.ModuleType(_name)
+            _module.__path__ = [str(_path)]
+            sys.modules[_name] = _module
+    __package__ = "custom_components.zte_wf830"
+
+import argparse
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+import os
+import time
+
+import aiohttp
+from aiohttp import web
+
+from .api import AsyncZteWf830ApiClient, DeviceSnapshot
+from .const import DEFAULT_MAX_IN_FLIGHT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "zte_wf830"
+
+DEFAULT_PORT = 9830
+DEFAULT_INTERVAL = 15
+
+
+@dataclass(frozen=True, slots=True)
+class MetricFamily:
+    name: str
+    type: str
+    help: str
+    unit: str = ""
+    # sample name suffix, "_total" for counters
+    suffix: str = ""
+
+
+GAUGE_FAMILIES: dict[str, MetricFamily] = {
+    "signal_strength": MetricFamily(
+        "signal_strength", "gauge", "Signal strength in bars out of 4."
+    ),
+    "rsrp0": MetricFamily("rsrp0_dbm", "gauge", "RSRP of antenna 0.", "dbm"),
+    "rsrp1": MetricFamily("rsrp1_dbm", "gauge", "RSRP of antenna 1.", "dbm"),
+    "rsrq": MetricFamily("rsrq_db", "gauge", "Reference signal quality.", "db"),
+    "sinr": MetricFamily("sinr_db", "gauge", "Signal to noise ratio.", "db"),
+    "current_download": MetricFamily(
+        "download_rate_bytes_per_second",
+        "gauge",
+        "Current download rate reported by the router.",
+        "bytes_per_second",
+    ),
+    "current_upload": MetricFamily(
+        "upload_rate_bytes_per_second",
+        "gauge",
+        "Current upload rate reported by the router.",
+        "bytes_per_second",
+    ),
+    "up": MetricFamily("up", "gauge", "Whether the last poll succeeded."),
+    "poll_duration": MetricFamily(
+        "poll_duration_seconds",
+        "gauge",
+        "Duration of the last poll.",
+        "seconds",
+    ),
+}
+COUNTER_FAMILIES: dict[str, MetricFamily] = {
+    "total_download": MetricFamily(
+        "download_bytes",
+        "counter",
+        "Bytes downloaded since the router started.",
+        "bytes",
+        "_total",
+    ),
+    "total_upload": MetricFamily(
+        "upload_bytes",
+        "counter",
+        "Bytes uploaded since the router started.",
+        "bytes",
+        "_total",
+    ),
+    "requests": MetricFamily(
+        "requests", "counter", "Requests sent to the router.", suffix="_total"
+    ),
+    "request_errors": MetricFamily(
+        "request_errors",
+        "counter",
+        "Requests that failed to reach the router.",
+        suffix="_total",
+    ),
+    "failed_polls": MetricFamily(
+        "failed_polls", "counter", "Polls that failed.", suffix="_total"
+    ),
+}
+# samples whose labels change with the device state
+INFO_FAMILIES: dict[str, MetricFamily] = {
+    "network": MetricFamily(
+        "network", "info", "Network type and status.", suffix="_info"
+    ),
+    "band": MetricFamily("band_active", "gauge", "LTE bands currently enabled."),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class OpenMetricsTemplate:
+    """Exposition text built once, with a slot per sample.
+
+    The metadata lines and the name and labels of every sample are rendered
+    up front. Updating a value only formats that one line, and the body is
+    joined again on the next scrape only if a line changed, so scrapes
+    between polls cost nothing but sending the cached bytes.
+    """
+
+    def __init__(
+        self, families: Iterable[tuple[str, MetricFamily]], labels: dict[str, str]
+    ) -> None:
+        self._labels = labels
+        self._lines: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._families: dict[str, MetricFamily] = {}
+
+        for key, family in families:
+            name = f"{METRIC_PREFIX}_{family.name}"
+            self._lines.append(f"# TYPE {name} {family.type}\n")
+            if family.unit:
+                self._lines.append(f"# UNIT {name} {family.unit}\n")
+            self._lines.append(f"# HELP {name} {family.help}\n")
+
+            self._slots[key] = len(self._lines)
+            self._families[key] = family
+            self._lines.append("")
+
+        self._lines.append("# EOF\n")
+
+        self._prefixes = {
+            key: f"{METRIC_PREFIX}_{family.name}{family.suffix}{{{_labels(labels)}}} "
+            for key, family in self._families.items()
+        }
+        self._body: bytes | None = None
+
+    def set(self, key: str, value: float | None) -> None:
+        """Set a sample, or leave it out with None."""
+        line = "" if value is None else f"{self._prefixes[key]}{value}\n"
+        self._set_line(key, line)
+
+    def set_labeled(self, key: str, samples: Iterable[dict[str, str]]) -> None:
+        """Replace a family's samples by one per label set, all valued 1."""
+        family = self._families[key]
+        name = f"{METRIC_PREFIX}_{family.name}{family.suffix}"
+        self._set_line(
+            key,
+            "".join(
+                f"{name}{{{_labels({**self._labels, **labels})}}} 1\n"
+                for labels in samples
+            ),
+        )
+
+    def _set_line(self, key: str, line: str) -> None:
+        slot = self._slots[key]
+        if self._lines[slot] != line:
+            self._lines[slot] = line
+            self._body = None
+
+    def render(self) -> bytes:
+        if self._body is None:
+            self._body = "".join(self._lines).encode()
+        return self._body
+
+
+class Collector:
+    """Polls one router every ``interval`` seconds into a template."""
+
+    def __init__(self, api_client: AsyncZteWf830ApiClient, interval: float) -> None:
+        self.api_client = api_client
+        self.interval = interval
+
+        self.template = OpenMetricsTemplate(
+            [
+                *GAUGE_FAMILIES.items(),
+                *COUNTER_FAMILIES.items(),
+                *INFO_FAMILIES.items(),
+            ],
+            {"host": api_client.host},
+        )
+        self.failed_polls = 0
+
+    async def poll(self) -> None:
+        started = time.perf_counter()
+        try:
+            snapshot = await self.api_client.get_snapshot()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Polling %s failed: %s", self.api_client.host, err)
+            self.failed_polls += 1
+            self._update(None)
+        else:
+            self._update(snapshot)
+        self.template.set("poll_duration", round(time.perf_counter() - started, 6))
+
+    def _update(self, snapshot: DeviceSnapshot | None) -> None:
+        template = self.template
+
+        template.set("up", 0 if snapshot is None else 1)
+        template.set("failed_polls", self.failed_polls)
+        template.set("requests", self.api_client.metrics.total_requests)
+        template.set("request_errors", self.api_client.metrics.total_errors)
+
+        if snapshot is None:
+            # stale values would look like a healthy router
+            for key in ("signal_strength", "rsrp0", "rsrp1", "rsrq", "sinr"):
+                template.set(key, None)
+            template.set("current_download", None)
+            template.set("current_upload", None)
+            template.set_labeled("network", [])
+            template.set_labeled("band", [])
+            return
+
+        signal = snapshot.signal_params
+        template.set("signal_strength", signal.strength)
+        template.set("rsrp0", signal.rsrp0)
+        template.set("rsrp1", signal.rsrp1)
+        template.set("rsrq", signal.rsrq)
+        template.set("sinr", signal.sinr)
+        template.set_labeled(
+            "network",
+            [
+                {
+                    "network_type": signal.network_type,
+                    "network_status": signal.network_status,
+                }
+            ],
+        )
+
+        transfer = snapshot.transfer_status
+        template.set("current_download", transfer.current_download)
+        template.set("current_upload", transfer.current_upload)
+        template.set("total_download", transfer.total_download)
+        template.set("total_upload", transfer.total_upload)
+
+        template.set_labeled(
+            "band", [{"band": str(band.number)} for band in snapshot.active_bands]
+        )
+
+    async def run(self) -> None:
+        """Poll forever, keeping to the interval however long polls take."""
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
+        while True:
+            await self.poll()
+            next_poll = max(next_poll + self.interval, loop.time())
+            await asyncio.sleep(next_poll - loop.time())
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.template.render(), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+
+def create_app(collector: Collector) -> web.Application:
+    app = web.Application()
+    app.router.add_get("/metrics", collector.handle_metrics)
+    return app
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    password = args.password or os.environ.get("ZTE_WF830_PASSWORD")
+    if not password:
+        raise SystemExit("No password given, use --password or ZTE_WF830_PASSWORD")
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=args.max_in_flight),
+        cookie_jar=aiohttp.DummyCookieJar(),
+    ) as session:
+        api_client = AsyncZteWf830ApiClient(
+            args.host, password, session, max_in_flight=args.max_in_flight
+        )
+        collector = Collector(api_client, args.interval)
+
+        runner = web.AppRunner(create_app(collector), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, args.bind, args.port).start()
+        _LOGGER.info("Serving metrics on http://%s:%s/metrics", args.bind, args.port)
+
+        try:
+            await collector.run()
+        finally:
+            await runner.cleanup()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", required=True, help="router address")
+    parser.add_argument("--password", help="smartadmin password")
+    parser.add_argument("--bind", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help="seconds between polls",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+        help="requests sent to the router at the same time",
+    )
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .api import ZteWf830ApiClient
-from .const import DEVICE_NAME, DOMAIN
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import AsyncZteWf830ApiClient
+from .const import (
+    CONF_AUTO_BAND_INTERVAL,
+    CONF_EXTRA_SENSORS,
+    CONF_MAX_IN_FLIGHT_REQUESTS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_TRANSFER_SIGNIFICANCE,
+    DEFAULT_AUTO_BAND_INTERVAL,
+    DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_TRANSFER_SIGNIFICANCE,
+    DEVICE_NAME,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +41,11 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required("smartadmin_password"): str,
     }
 )
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("smartadmin_password"): str,
+    }
+)
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
@@ -32,12 +54,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
 
-    client = ZteWf830ApiClient(data["host"], data["smartadmin_password"])
+    client = AsyncZteWf830ApiClient(
+        data["host"], data["smartadmin_password"], async_get_clientsession(hass)
+    )
 
-    if not await hass.async_add_executor_job(client.authenticate):
+    if not await client.authenticate():
         raise InvalidAuth()
 
-    serial_number = await hass.async_add_executor_job(client.get_serial_number)
+    serial_number = await client.get_serial_number()
 
     # Return info that you want to store in the config entry.
     return {"title": DEVICE_NAME, "serial_number": serial_number}
@@ -48,6 +72,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _reauth_entry: config_entries.ConfigEntry | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Create the options flow."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -77,6 +111,118 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """Ask for the password again after the router rejected it."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the new password."""
+        assert self._reauth_entry is not None
+        errors = {}
+
+        if user_input is not None:
+            data = {**self._reauth_entry.data, **user_input}
+            try:
+                await validate_input(self.hass, data)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                self.hass.config_entries.async_update_entry(
+                    self._reauth_entry, data=data
+                )
+                self.hass.async_create_task(
+                    self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
+                )
+                return self.async_abort(reason="reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={"host": self._reauth_entry.data["host"]},
+            errors=errors,
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle polling options for ZTE WF830."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        # OptionsFlow.config_entry is only provided from Home Assistant 2024.12
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_POLL_INTERVAL] > user_input[CONF_MAX_POLL_INTERVAL]:
+                errors["base"] = "invalid_poll_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+
+        extra_sensors = options.get(CONF_EXTRA_SENSORS, [])
+        # discovered values of the loaded entry, plus whatever is selected
+        sensor_options = {key: key for key in extra_sensors}
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id):
+            sensor_options.update(coordinator.schema.sensor_options())
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                vol.Required(
+                    CONF_TRANSFER_SIGNIFICANCE,
+                    default=options.get(
+                        CONF_TRANSFER_SIGNIFICANCE, DEFAULT_TRANSFER_SIGNIFICANCE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_AUTO_BAND_INTERVAL,
+                    default=options.get(
+                        CONF_AUTO_BAND_INTERVAL, DEFAULT_AUTO_BAND_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_IN_FLIGHT_REQUESTS,
+                    default=options.get(
+                        CONF_MAX_IN_FLIGHT_REQUESTS, DEFAULT_MAX_IN_FLIGHT_REQUESTS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                vol.Optional(
+                    CONF_EXTRA_SENSORS, default=extra_sensors
+                ): cv.multi_select(sensor_options),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
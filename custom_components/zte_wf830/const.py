@@ -6,3 +6,82 @@ DEVICE_NAME = "ZTE WF830"
 # 3 seconds
 DEFAULT_REQUEST_TIMEOUT = 3
 CHANGE_BAND_TIMEOUT = 10
+
+# concurrent NODE_GET requests arriving within this many seconds are merged
+COALESCE_WINDOW = 0.01
+
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_TRANSFER_SIGNIFICANCE = "transfer_significance"
+CONF_EXTRA_SENSORS = "extra_sensors"
+CONF_MAX_IN_FLIGHT_REQUESTS = "max_in_flight_requests"
+# seconds
+DEFAULT_MIN_POLL_INTERVAL = 2
+DEFAULT_MAX_POLL_INTERVAL = 60
+# KB/s the current transfer sensors must move before their state is written
+DEFAULT_TRANSFER_SIGNIFICANCE = 0
+
+# retry policy for a single call, delays in seconds
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 5
+# consecutive failed calls before requests fail fast, and for how long
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+# the router drops sessions idle for this many seconds; log in again a bit
+# before that happens
+SESSION_LIFETIME = 300
+SESSION_REFRESH_MARGIN = 15
+
+# smoothing of the throughput computed from the transfer counters, in seconds
+THROUGHPUT_EWMA_TIME_CONSTANT = 30
+THROUGHPUT_WINDOW = 300
+
+# signal statistics sensors cover this many seconds of samples
+SIGNAL_STATS_WINDOW = 900
+
+CONF_AUTO_BAND_INTERVAL = "auto_band_interval"
+# hours between automatic band re-evaluations
+DEFAULT_AUTO_BAND_INTERVAL = 6
+# seconds the modem gets to re-attach after a band change, then samples taken
+BAND_SETTLE_TIME = 30
+BAND_SAMPLE_COUNT = 5
+BAND_SAMPLE_INTERVAL = 2
+
+# LTE bands of the WF830 that get a switch before the device reports them
+DEFAULT_LTE_BANDS = (1, 3, 7, 20)
+
+# band toggles within this many seconds are merged into one write
+BAND_CHANGE_DELAY = 1.5
+# after a band change, poll the active bands this often (seconds) until the
+# device reports the new selection or the timeout expires
+BAND_CONFIRM_INTERVAL = 1
+BAND_CONFIRM_TIMEOUT = 20
+
+# after a reboot the web server is probed with backoff from
+# REBOOT_PROBE_INTERVAL up to REBOOT_PROBE_MAX_INTERVAL seconds, each probe
+# waiting REBOOT_PROBE_TIMEOUT for an answer. A router still answering
+# REBOOT_SHUTDOWN_TIMEOUT seconds after the command, or not back after
+# REBOOT_TIMEOUT, is left to the regular polling.
+REBOOT_PROBE_INTERVAL = 1
+REBOOT_PROBE_MAX_INTERVAL = 10
+REBOOT_PROBE_TIMEOUT = 2
+REBOOT_SHUTDOWN_TIMEOUT = 30
+REBOOT_TIMEOUT = 300
+
+# polls of all routers share this many slots and start staggered over this
+# many seconds
+FLEET_MAX_CONCURRENT_POLLS = 4
+FLEET_STAGGER_PERIOD = 1
+# requests sent to one router at the same time; also the keep-alive
+# connections kept open to it
+DEFAULT_MAX_IN_FLIGHT_REQUESTS = 2
+
+# discovery probes node ids N_1_1 to N_<group>_<index>, that many per request,
+# and LIST_FULL lists 0 to DISCOVERY_MAX_LIST
+DISCOVERY_MAX_NODE_GROUP = 12
+DISCOVERY_MAX_NODE_INDEX = 100
+DISCOVERY_BATCH_SIZE = 100
+DISCOVERY_MAX_LIST = 8
+SCHEMA_STORAGE_VERSION = 1
@@ -0,0 +1,387 @@
+"""Device-level update coordinator for the ZTE WF830 integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import contextlib
+import dataclasses
+from datetime import timedelta
+import logging
+import math
+import time
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .api import (
+    SNAPSHOT_NODES,
+    TRANSFER_LIST,
+    AsyncZteWf830ApiClient,
+    DeviceSnapshot,
+    LteBand,
+    NodeBatch,
+    NodeId,
+    ZteCommands,
+    ZteNode,
+    parse_snapshot,
+)
+from .const import (
+    BAND_CHANGE_DELAY,
+    BAND_CONFIRM_INTERVAL,
+    BAND_CONFIRM_TIMEOUT,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    SIGNAL_STATS_WINDOW,
+)
+from .discovery import DeviceSchema, parse_list_item_key
+from .fleet import FleetScheduler
+from .history import MetricHistory
+from .metrics import LatencyHistogram
+from .rates import ThroughputMeter
+from .retry import RebootPolicy
+from .scheduler import AdaptivePollScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# LIST_FULL is scheduled like a node, under its command name; all lists are
+# read together.
+PollKey = NodeId | ZteCommands
+
+# SignalParams fields kept in history, with the node each one is read from
+SIGNAL_HISTORY_NODES: dict[str, ZteNode] = {
+    "rsrp0": ZteNode.GET_RSRP0,
+    "rsrp1": ZteNode.GET_RSRP1,
+    "rsrq": ZteNode.GET_RSRQ,
+    "sinr": ZteNode.GET_SINR,
+}
+
+
+class ZteDeviceUpdateCoordinator(DataUpdateCoordinator[DeviceSnapshot]):
+    """Polls the whole device state once and fans it out to all platforms.
+
+    Each tick only reads the nodes the scheduler considers due; the rest of
+    the snapshot is filled from the last values seen. Discovered nodes and
+    list items picked in ``extra_sensors`` ride along in the same batch.
+
+    With a ``fleet`` the polls are timed by the fleet scheduler and take one
+    of its slots, otherwise by the coordinator's own interval.
+
+    While the device reboots, polling is suspended and the device is watched
+    according to ``reboot_policy`` instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: AsyncZteWf830ApiClient,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        schema: DeviceSchema | None = None,
+        extra_sensors: Iterable[str] = (),
+        fleet: FleetScheduler | None = None,
+        reboot_policy: RebootPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="ZTE WF830",
+            update_interval=(
+                None if fleet is not None else timedelta(seconds=min_poll_interval)
+            ),
+        )
+
+        self.api_client = api_client
+        self.fleet = fleet
+        # like the coordinator's own timer: skipped once shutdown started
+        self.fleet_member = (
+            fleet.add(lambda: self._async_refresh(scheduled=True))
+            if fleet is not None
+            else None
+        )
+        self._poll_slot: contextlib.AbstractAsyncContextManager = (
+            fleet.slot() if fleet is not None else contextlib.nullcontext()
+        )
+        self.schema = schema or DeviceSchema()
+
+        self.reboot_policy = reboot_policy or RebootPolicy()
+        self.rebooting = False
+        self._reboot_task: asyncio.Task | None = None
+
+        extra_nodes: list[NodeId] = []
+        self._list_ids: dict[int, None] = {TRANSFER_LIST: None}
+        for key in extra_sensors:
+            if (list_item := parse_list_item_key(key)) is None:
+                extra_nodes.append(key)
+            else:
+                self._list_ids[list_item[0]] = None
+
+        self.scheduler: AdaptivePollScheduler[PollKey] = AdaptivePollScheduler(
+            [*SNAPSHOT_NODES, *extra_nodes, ZteCommands.LIST_FULL],
+            min_poll_interval,
+            max_poll_interval,
+        )
+
+        self.download_meter = ThroughputMeter()
+        self.upload_meter = ThroughputMeter()
+
+        history_capacity = math.ceil(SIGNAL_STATS_WINDOW / min_poll_interval) + 1
+        self.signal_history = {
+            metric: MetricHistory(history_capacity, SIGNAL_STATS_WINDOW)
+            for metric in SIGNAL_HISTORY_NODES
+        }
+
+        # wall time of each tick's fetch, retries and re-logins included
+        self.poll_duration = LatencyHistogram()
+
+        self._node_values: dict[NodeId, str] = {}
+        self._lists: dict[int, list[dict[str, str]]] = {}
+
+        # band selection shown while a change is being written and confirmed
+        self._pending_bands: list[LteBand] | None = None
+        self._band_generation = 0
+        # held by every band write, including the band optimizer's
+        self.band_lock = asyncio.Lock()
+
+    def node_value(self, node: NodeId) -> str | None:
+        return self._node_values.get(node)
+
+    def list_item_value(self, list_id: int, entry: int, item: str) -> str | None:
+        entries = self._lists.get(list_id, [])
+        return entries[entry].get(item) if entry < len(entries) else None
+
+    async def async_refresh_nodes(self, keys: Iterable[PollKey]) -> None:
+        """Re-read the given nodes as soon as possible, e.g. after a write."""
+        self.scheduler.reset(keys)
+        await self.async_request_refresh()
+
+    @callback
+    def async_set_band_enabled(self, band: LteBand, enabled: bool) -> None:
+        """Add ``band`` to or remove it from the selection."""
+        if self._pending_bands is not None:
+            current = self._pending_bands
+        elif self.data is not None:
+            current = self.data.active_bands
+        else:
+            raise HomeAssistantError("Active bands are not known yet")
+
+        mask = LteBand.to_mask(current)
+        mask = mask | band.mask if enabled else mask & ~band.mask
+        if not mask:
+            raise HomeAssistantError("At least one band must stay enabled")
+
+        self.async_request_bands(LteBand.from_mask(mask))
+
+    @callback
+    def async_request_bands(self, bands: list[LteBand]) -> None:
+        """Show ``bands`` as active right away and write them in the background.
+
+        The write waits BAND_CHANGE_DELAY for further changes and writes are
+        applied one at a time. A change superseded by a newer one before its
+        turn is dropped, so rapid toggles end in a single write of the final
+        selection.
+        """
+        self._band_generation += 1
+        self._pending_bands = list(bands)
+
+        if self.data is not None:
+            self.async_set_updated_data(
+                dataclasses.replace(self.data, active_bands=list(bands))
+            )
+
+        self.hass.async_create_background_task(
+            self._async_apply_bands(self._band_generation, list(bands)),
+            name=f"{self.name} band change",
+        )
+
+    async def _async_apply_bands(self, generation: int, bands: list[LteBand]) -> None:
+        await asyncio.sleep(BAND_CHANGE_DELAY)
+
+        async with self.band_lock:
+            if generation != self._band_generation:
+                return
+
+            try:
+                await self.api_client.set_bands(bands)
+                confirmed = await self._async_confirm_bands(bands)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Changing bands failed: %s", err)
+                confirmed = False
+
+            if generation != self._band_generation:
+                return
+
+            if not confirmed:
+                _LOGGER.warning(
+                    "Device did not apply bands %s, rolling back",
+                    [band.name for band in bands],
+                )
+
+            self._pending_bands = None
+            self.scheduler.reset([ZteNode.GET_ACTIVE_BANDS])
+            await self.async_refresh()
+
+    async def _async_confirm_bands(self, bands: list[LteBand]) -> bool:
+        """Poll the active bands until they match ``bands`` or time runs out."""
+        deadline = time.monotonic() + BAND_CONFIRM_TIMEOUT
+
+        while True:
+            active_bands = await self.api_client.get_active_bands()
+            if LteBand.to_mask(active_bands) == LteBand.to_mask(bands):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(BAND_CONFIRM_INTERVAL)
+
+    async def async_reboot(self) -> None:
+        """Reboot the device, then resume polling as soon as it is back.
+
+        Scheduled polls stop and the entities turn unavailable right away.
+        The recovery runs in the background: probe the web server until it
+        went down and answers again, log in once, then refresh every value.
+        """
+        if self.rebooting:
+            raise HomeAssistantError("Device is already rebooting")
+
+        self._suspend_polling()
+        try:
+            await self.api_client.reboot()
+        except Exception:
+            self.rebooting = False
+            await self.async_request_refresh()
+            raise
+
+        self.async_set_update_error(UpdateFailed("Device is rebooting"))
+        self._reboot_task = self.hass.async_create_background_task(
+            self._async_recover_from_reboot(), name=f"{self.name} reboot recovery"
+        )
+
+    def _suspend_polling(self) -> None:
+        self.rebooting = True
+        if self.fleet_member is not None:
+            self.fleet_member.cancel()
+        else:
+            self.update_interval = None
+            self._unschedule_refresh()
+
+    async def _async_recover_from_reboot(self) -> None:
+        policy = self.reboot_policy
+        started = time.monotonic()
+        went_down = False
+        attempt = 0
+
+        try:
+            while (elapsed := time.monotonic() - started) < policy.timeout:
+                attempt += 1
+                await asyncio.sleep(policy.backoff.delay(attempt))
+
+                if not await self.api_client.probe():
+                    if not went_down:
+                        # start the backoff over for the boot itself
+                        went_down = True
+                        attempt = 0
+                    continue
+                if not went_down:
+                    if elapsed < policy.shutdown_timeout:
+                        continue
+                    _LOGGER.warning("Device kept answering after the reboot")
+
+                try:
+                    if not await self.api_client.authenticate():
+                        _LOGGER.warning("Logging in after the reboot failed")
+                    _LOGGER.info(
+                        "Device is back %.1fs after rebooting",
+                        time.monotonic() - started,
+                    )
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    # the web server is up before the rest of the firmware
+                    _LOGGER.debug("Device not ready after reboot yet: %s", err)
+            else:
+                _LOGGER.warning(
+                    "Device did not come back within %ss of rebooting",
+                    policy.timeout,
+                )
+        finally:
+            self.rebooting = False
+
+        self.api_client.circuit_breaker.reset()
+        self.scheduler.reset(self.scheduler.intervals())
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        if self._reboot_task is not None:
+            self._reboot_task.cancel()
+        if self.fleet is not None and self.fleet_member is not None:
+            self.fleet.remove(self.fleet_member)
+        await super().async_shutdown()
+
+    def _schedule_next_poll(self) -> None:
+        if self.rebooting or self._shutdown_requested:
+            # a poll that was in flight when the reboot or the shutdown started
+            return
+
+        delay = self.scheduler.next_delay(time.monotonic())
+
+        if self.fleet_member is not None:
+            self.fleet_member.schedule(delay)
+        else:
+            self.update_interval = timedelta(seconds=delay)
+
+    async def _async_update_data(self) -> DeviceSnapshot:
+        if self.rebooting:
+            # the reboot recovery resumes polling
+            raise UpdateFailed("Device is rebooting")
+
+        try:
+            return await self._async_poll()
+        finally:
+            self._schedule_next_poll()
+
+    async def _async_poll(self) -> DeviceSnapshot:
+        due = self.scheduler.due(time.monotonic())
+
+        batch = NodeBatch().add(key for key in due if key != ZteCommands.LIST_FULL)
+        if ZteCommands.LIST_FULL in due:
+            batch.add_lists(self._list_ids)
+
+        started = time.perf_counter()
+        try:
+            async with self._poll_slot:
+                values, lists = await self.api_client.fetch(batch)
+        except Exception as err:
+            raise UpdateFailed(
+                f"Communication with API failed: {type(err)}, {err}"
+            ) from err
+        finally:
+            self.poll_duration.observe(time.perf_counter() - started)
+
+        now = time.monotonic()
+        for node, value in values.items():
+            self.scheduler.observe(node, value, now)
+        if lists:
+            self.scheduler.observe(ZteCommands.LIST_FULL, lists, now)
+            self._lists.update(lists)
+        self._node_values.update(values)
+
+        snapshot = parse_snapshot(self._node_values, self._lists)
+        if self._pending_bands is not None:
+            snapshot.active_bands = list(self._pending_bands)
+
+        if lists:
+            self.download_meter.update(snapshot.transfer_status.total_download, now)
+            self.upload_meter.update(snapshot.transfer_status.total_upload, now)
+
+        for metric, node in SIGNAL_HISTORY_NODES.items():
+            if node in values:
+                self.signal_history[metric].append(
+                    now, getattr(snapshot.signal_params, metric)
+                )
+
+        return snapshot
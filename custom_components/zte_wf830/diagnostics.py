@@ -0,0 +1,61 @@
+"""Diagnostics support for the ZTE WF830 integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ZteDeviceUpdateCoordinator
+
+TO_REDACT = {"smartadmin_password"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ZteDeviceUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api_client = coordinator.api_client
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "poll_intervals": {
+                getattr(key, "name", key): interval
+                for key, interval in coordinator.scheduler.intervals().items()
+            },
+            "poll_duration": coordinator.poll_duration.as_dict(),
+            "rebooting": coordinator.rebooting,
+            "fleet_size": (
+                len(coordinator.fleet) if coordinator.fleet is not None else None
+            ),
+        },
+        # ids only: the discovered values include Wi-Fi keys and identifiers
+        "schema": {
+            "nodes": list(coordinator.schema.nodes),
+            "lists": {
+                str(list_id): len(entries)
+                for list_id, entries in coordinator.schema.lists.items()
+            },
+        },
+        "client": {
+            "circuit_open": api_client.circuit_breaker.is_open,
+            "consecutive_failures": api_client.circuit_breaker.failures,
+            "in_flight_requests": api_client.request_queue.in_flight,
+            "queued_requests": api_client.request_queue.queued,
+            **api_client.metrics.as_dict(),
+        },
+    }
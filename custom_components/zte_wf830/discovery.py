@@ -0,0 +1,105 @@
+"""Discovery of the nodes and lists a WF830 exposes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from .api import AsyncZteWf830ApiClient, NodeId
+from .const import (
+    DISCOVERY_BATCH_SIZE,
+    DISCOVERY_MAX_LIST,
+    DISCOVERY_MAX_NODE_GROUP,
+    DISCOVERY_MAX_NODE_INDEX,
+)
+from .retry import DeviceUnavailableError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DeviceSchema:
+    """Everything readable on a device, with the value seen during discovery.
+
+    ``nodes`` maps node ids to a sample value. ``lists`` holds the entries
+    of every non-empty LIST_FULL list by list id.
+    """
+
+    nodes: dict[NodeId, str] = field(default_factory=dict)
+    lists: dict[int, list[dict[str, str]]] = field(default_factory=dict)
+
+    def sensor_options(self) -> dict[str, str]:
+        """Every readable value as ``key: label``, for selecting sensors."""
+        options = {node: f"{node} ({value})" for node, value in self.nodes.items()}
+        for list_id, entries in self.lists.items():
+            for entry_index, entry in enumerate(entries):
+                for item, value in entry.items():
+                    key = list_item_key(list_id, entry_index, item)
+                    options[key] = f"List {key} ({value})"
+        return options
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "lists": {str(list_id): entries for list_id, entries in self.lists.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeviceSchema:
+        return cls(
+            nodes=dict(data["nodes"]),
+            lists={int(list_id): entries for list_id, entries in data["lists"].items()},
+        )
+
+
+def list_item_key(list_id: int, entry: int, item: str) -> str:
+    """Key of one item of a list entry, e.g. ``0/0/L_1``."""
+    return f"{list_id}/{entry}/{item}"
+
+
+def parse_list_item_key(key: str) -> tuple[int, int, str] | None:
+    """Inverse of list_item_key, None for node ids."""
+    parts = key.split("/")
+    if len(parts) != 3:
+        return None
+    return int(parts[0]), int(parts[1]), parts[2]
+
+
+async def async_discover(api_client: AsyncZteWf830ApiClient) -> DeviceSchema:
+    """Probe every node id and list id in the known ranges.
+
+    Node ids are ``N_<group>_<index>``; they are read in batches and the ones
+    with a value are kept. Lists are read in order until one fails to load;
+    empty ones are skipped. This costs a few dozen requests and is meant to
+    run once per device, with the result cached. The probes are not broken
+    down by node in the client metrics.
+    """
+    schema = DeviceSchema()
+
+    candidates = [
+        f"N_{group}_{index}"
+        for group in range(1, DISCOVERY_MAX_NODE_GROUP + 1)
+        for index in range(1, DISCOVERY_MAX_NODE_INDEX + 1)
+    ]
+    for start in range(0, len(candidates), DISCOVERY_BATCH_SIZE):
+        values = await api_client.get_node_values(
+            candidates[start : start + DISCOVERY_BATCH_SIZE], record_nodes=False
+        )
+        schema.nodes.update((node, value) for node, value in values.items() if value)
+
+    for list_id in range(DISCOVERY_MAX_LIST + 1):
+        try:
+            entries = await api_client.get_list(list_id)
+        except DeviceUnavailableError as err:
+            # stop before repeated failures open the circuit breaker
+            _LOGGER.debug("Stopping list discovery at list %s: %s", list_id, err)
+            break
+        if entries:
+            schema.lists[list_id] = entries
+
+    _LOGGER.info(
+        "Discovered %s nodes and %s lists", len(schema.nodes), len(schema.lists)
+    )
+
+    return schema
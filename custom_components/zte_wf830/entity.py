@@ -0,0 +1,35 @@
+"""Base entity for the ZTE WF830 integration."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ZteDeviceUpdateCoordinator
+
+
+class ZteCoordinatorEntity(CoordinatorEntity[ZteDeviceUpdateCoordinator]):
+    """Entity fed by the device coordinator that only writes meaningful changes.
+
+    Every coordinator tick reaches every entity. Writing state only when the
+    entity's own value changed, or when availability flipped, keeps unchanged
+    values out of the state machine and the recorder.
+    """
+
+    _written_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        # entities added after the first refresh start from its data
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
+    @callback
+    def _async_write_ha_state_if(self, changed: bool) -> None:
+        available = self.available
+        if not changed and available == self._written_available:
+            return
+
+        self._written_available = available
+        self.async_write_ha_state()
@@ -0,0 +1,114 @@
+"""Shared poll scheduling for every configured router."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import math
+import time
+
+from .const import FLEET_MAX_CONCURRENT_POLLS, FLEET_STAGGER_PERIOD
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FleetScheduler:
+    """Times the polls of all routers and limits how many run at once.
+
+    Each member polls on its own phase of a ``stagger_period`` grid: with
+    ``n`` members, member ``i`` only starts polls at ``i / n`` of the period.
+    Routers on the same interval therefore take turns instead of firing
+    together, at the cost of delaying a poll by less than one period. At most
+    ``max_concurrent`` polls hold a slot at a time, whichever router they
+    are for.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FLEET_MAX_CONCURRENT_POLLS,
+        stagger_period: float = FLEET_STAGGER_PERIOD,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.stagger_period = stagger_period
+
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._members: list[FleetMember] = []
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, poll: Callable[[], Awaitable[None]]) -> FleetMember:
+        member = FleetMember(self, poll)
+        self._members.append(member)
+        return member
+
+    def remove(self, member: FleetMember) -> None:
+        member.cancel()
+        if member in self._members:
+            self._members.remove(member)
+
+    def slot(self) -> asyncio.Semaphore:
+        """Held for the duration of one poll's requests."""
+        return self._slots
+
+    def phase(self, member: FleetMember) -> float:
+        """Offset of the member's grid in seconds."""
+        if len(self._members) < 2 or member not in self._members:
+            return 0.0
+        return self._members.index(member) / len(self._members) * self.stagger_period
+
+    def align(self, member: FleetMember, when: float) -> float:
+        """Earliest time at or after ``when`` on the member's grid."""
+        if len(self._members) < 2:
+            return when
+
+        period = self.stagger_period
+        offset = self.phase(member)
+
+        return math.ceil((when - offset) / period) * period + offset
+
+
+class FleetMember:
+    """One router's place in the fleet, polled by calling ``poll``."""
+
+    def __init__(
+        self, fleet: FleetScheduler, poll: Callable[[], Awaitable[None]]
+    ) -> None:
+        self.fleet = fleet
+        self._poll = poll
+
+        self._handle: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+    def schedule(self, delay: float) -> None:
+        """Poll ``delay`` seconds from now, moved onto the member's grid.
+
+        Replaces any poll scheduled before.
+        """
+        self.cancel()
+
+        loop = asyncio.get_running_loop()
+        when = self.fleet.align(self, time.monotonic() + delay)
+        # the loop's clock is monotonic too, but not necessarily the same one
+        self._handle = loop.call_at(
+            loop.time() + max(0.0, when - time.monotonic()), self._start
+        )
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _start(self) -> None:
+        self._handle = None
+        if self._task is not None and not self._task.done():
+            # still polling, which schedules the next poll when it is done
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            await self._poll()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Scheduled poll failed")
@@ -0,0 +1,90 @@
+"""In-memory history of polled signal metrics."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import math
+
+
+@dataclass(slots=True)
+class WindowStats:
+    min: float
+    max: float
+    mean: float
+    p10: float
+    count: int
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted, non-empty list."""
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (
+        sorted_values[upper] - sorted_values[lower]
+    ) * (position - lower)
+
+
+class MetricHistory:
+    """Fixed-size ring buffer of timestamped samples backed by two arrays.
+
+    Appending overwrites the oldest sample once ``capacity`` is reached, so
+    memory stays constant however long the integration runs. Statistics over
+    the last ``window`` seconds are computed on demand and cached until the
+    next sample arrives.
+    """
+
+    def __init__(self, capacity: int, window: float) -> None:
+        self.capacity = capacity
+        self.window = window
+
+        self._times = array("d", [0.0]) * capacity
+        self._values = array("d", [0.0]) * capacity
+        self._next = 0
+        self._size = 0
+
+        self._stats: WindowStats | None = None
+        self._stats_valid = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+        self._stats_valid = False
+
+    def values_since(self, since: float) -> list[float]:
+        """Samples taken at or after ``since``, oldest first."""
+        values = []
+        for offset in range(self._size, 0, -1):
+            index = (self._next - offset) % self.capacity
+            if self._times[index] >= since:
+                values.append(self._values[index])
+        return values
+
+    def stats(self) -> WindowStats | None:
+        """Statistics over the window ending at the latest sample."""
+        if self._stats_valid:
+            return self._stats
+
+        self._stats = None
+        if self._size:
+            latest = self._times[(self._next - 1) % self.capacity]
+            values = self.values_since(latest - self.window)
+            values.sort()
+            self._stats = WindowStats(
+                min=values[0],
+                max=values[-1],
+                mean=math.fsum(values) / len(values),
+                p10=percentile(values, 0.1),
+                count=len(values),
+            )
+
+        self._stats_valid = True
+        return self._stats
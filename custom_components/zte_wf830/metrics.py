@@ -0,0 +1,223 @@
+"""Request instrumentation for the WF830 API client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+# Upper bounds in seconds; a final unbounded bucket catches the rest.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# XML parsing takes microseconds, not milliseconds.
+PARSE_TIME_BUCKETS: tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.1,
+)
+
+
+class LatencyHistogram:
+    """Cumulative histogram of durations with fixed buckets.
+
+    Recording is a bisect and a few additions, so it can sit on every request
+    without costing anything noticeable. Quantiles are estimated as the upper
+    bound of the bucket they fall in, capped at the largest value seen.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, fraction: float) -> float | None:
+        if not self.count:
+            return None
+
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self.max)
+                return self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "last": self.last,
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self.buckets, self.counts)
+                },
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class RequestStats:
+    """Latency, failures, size and parse time of one kind of request."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.parse_time = LatencyHistogram(PARSE_TIME_BUCKETS)
+        self.errors = 0
+        self.bytes_received = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "latency": self.latency.as_dict(),
+            "parse_time": self.parse_time.as_dict(),
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class ClientMetrics:
+    """Counters of everything the client sent to the device.
+
+    Requests are broken down by command and, for node requests, by every
+    node they carried. Latency covers the round-trip including reading the
+    body; parse time is the XML parsing that follows it. Time spent in the
+    request queue is kept apart, by priority.
+    """
+
+    def __init__(self) -> None:
+        self.commands: dict[str, RequestStats] = {}
+        self.nodes: dict[str, LatencyHistogram] = {}
+        self.login = RequestStats()
+        # retried attempts per client call
+        self.retries: Counter[str] = Counter()
+        self.logins = 0
+        self.failed_logins = 0
+        self.expired_sessions = 0
+        self.queue_wait: dict[str, LatencyHistogram] = {}
+        # queued polls replaced by a newer identical one before being sent
+        self.superseded_requests = 0
+
+    def _command(self, command: str) -> RequestStats:
+        if (stats := self.commands.get(command)) is None:
+            stats = self.commands[command] = RequestStats()
+        return stats
+
+    def record_request(
+        self, command: str, nodes: Iterable[str], seconds: float, size: int
+    ) -> None:
+        stats = self._command(command)
+        stats.latency.observe(seconds)
+        stats.bytes_received += size
+
+        for node in nodes:
+            if (histogram := self.nodes.get(node)) is None:
+                histogram = self.nodes[node] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def record_error(self, command: str) -> None:
+        self._command(command).errors += 1
+
+    def record_parse(self, command: str, seconds: float) -> None:
+        self._command(command).parse_time.observe(seconds)
+
+    def record_queue_wait(self, priority: str, seconds: float) -> None:
+        if (histogram := self.queue_wait.get(priority)) is None:
+            histogram = self.queue_wait[priority] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def record_retry(self, call: str) -> None:
+        self.retries[call] += 1
+
+    def record_login(self, seconds: float, size: int, authenticated: bool) -> None:
+        self.logins += 1
+        self.login.latency.observe(seconds)
+        self.login.bytes_received += size
+        if not authenticated:
+            self.failed_logins += 1
+            self.login.errors += 1
+
+    @property
+    def reauthentications(self) -> int:
+        """Logins beyond the first, i.e. sessions that had to be renewed."""
+        return max(0, self.logins - 1)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.latency.count for stats in self.commands.values())
+
+    @property
+    def total_errors(self) -> int:
+        return sum(stats.errors for stats in self.commands.values())
+
+    @property
+    def total_retries(self) -> int:
+        return sum(self.retries.values())
+
+    @property
+    def bytes_received(self) -> int:
+        return self.login.bytes_received + sum(
+            stats.bytes_received for stats in self.commands.values()
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.total_requests,
+            "errors": self.total_errors,
+            "retries": dict(self.retries),
+            "logins": self.logins,
+            "failed_logins": self.failed_logins,
+            "reauthentications": self.reauthentications,
+            "expired_sessions": self.expired_sessions,
+            "superseded_requests": self.superseded_requests,
+            "bytes_received": self.bytes_received,
+            "login": self.login.as_dict(),
+            "queue_wait": {
+                priority: histogram.as_dict()
+                for priority, histogram in self.queue_wait.items()
+            },
+            "commands": {
+                command: stats.as_dict() for command, stats in self.commands.items()
+            },
+            "nodes": {
+                node: histogram.as_dict() for node, histogram in self.nodes.items()
+            },
+        }
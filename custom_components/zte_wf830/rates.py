@@ -0,0 +1,81 @@
+"""Throughput computed from the router's cumulative transfer counters."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+
+from .const import THROUGHPUT_EWMA_TIME_CONSTANT, THROUGHPUT_WINDOW
+
+
+class ThroughputMeter:
+    """Turns samples of a cumulative byte counter into rates in bytes/s.
+
+    Each new sample yields the average rate since the previous one, so the
+    result is exact however far apart the samples are. Two smoothed views
+    are kept on top of that: an exponentially weighted moving average whose
+    weight depends on the time between samples, and the plain average over
+    the last ``window`` seconds. A counter that goes backwards was reset by a
+    reboot; the sample becomes the new baseline instead of a negative rate.
+    """
+
+    def __init__(
+        self,
+        window: float = THROUGHPUT_WINDOW,
+        ewma_time_constant: float = THROUGHPUT_EWMA_TIME_CONSTANT,
+    ) -> None:
+        self.window = window
+        self.ewma_time_constant = ewma_time_constant
+
+        self.rate: float | None = None
+        self.ewma: float | None = None
+
+        self._last_total: int | None = None
+        self._last_time = 0.0
+        # (sample time, bytes, seconds) for every interval inside the window
+        self._intervals: deque[tuple[float, int, float]] = deque()
+        self._window_bytes = 0
+        self._window_seconds = 0.0
+
+    def update(self, total: int, now: float) -> None:
+        last_total, last_time = self._last_total, self._last_time
+        self._last_total, self._last_time = total, now
+
+        if last_total is None or now <= last_time:
+            return
+
+        delta = total - last_total
+        if delta < 0:
+            self.reset_smoothing()
+            return
+
+        elapsed = now - last_time
+        self.rate = delta / elapsed
+
+        if self.ewma is None:
+            self.ewma = self.rate
+        else:
+            alpha = 1 - math.exp(-elapsed / self.ewma_time_constant)
+            self.ewma += alpha * (self.rate - self.ewma)
+
+        self._intervals.append((now, delta, elapsed))
+        self._window_bytes += delta
+        self._window_seconds += elapsed
+        while self._intervals and self._intervals[0][0] <= now - self.window:
+            _, old_delta, old_elapsed = self._intervals.popleft()
+            self._window_bytes -= old_delta
+            self._window_seconds -= old_elapsed
+
+    @property
+    def window_average(self) -> float | None:
+        if not self._intervals:
+            return None
+        return self._window_bytes / self._window_seconds
+
+    def reset_smoothing(self) -> None:
+        """Forget past rates, keeping the last sample as the baseline."""
+        self.rate = None
+        self.ewma = None
+        self._intervals.clear()
+        self._window_bytes = 0
+        self._window_seconds = 0.0
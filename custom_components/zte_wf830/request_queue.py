@@ -0,0 +1,153 @@
+"""Per-device request queue for the WF830 API client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from enum import IntEnum
+import heapq
+import itertools
+import time
+from typing import Any
+
+from .const import DEFAULT_MAX_IN_FLIGHT_REQUESTS
+from .metrics import ClientMetrics
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued requests are sent, lowest first."""
+
+    LOGIN = 0
+    WRITE = 1
+    POLL = 2
+
+
+class _QueuedRequest:
+    __slots__ = (
+        "priority",
+        "key",
+        "send",
+        "future",
+        "waiters",
+        "queued_at",
+        "sent",
+    )
+
+    def __init__(
+        self,
+        priority: RequestPriority,
+        key: Hashable | None,
+        send: Callable[[], Awaitable[Any]],
+        future: asyncio.Future,
+    ) -> None:
+        self.priority = priority
+        self.key = key
+        self.send = send
+        self.future = future
+        self.waiters = 1
+        self.queued_at = time.monotonic()
+        self.sent = False
+
+
+class RequestQueue:
+    """Limits the requests in flight to one device and orders the rest.
+
+    The goahead server copes badly with concurrent requests, so at most
+    ``max_in_flight`` are sent at a time. Waiting requests go out by
+    priority, then in arrival order, so a login or a write is sent before
+    polls that were queued earlier.
+
+    A poll submitted with a ``key`` replaces a queued poll with the same key:
+    the stale one is dropped, the newer one takes its place in the queue and
+    its response answers both callers.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+        metrics: ClientMetrics | None = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.metrics = metrics or ClientMetrics()
+
+        self._heap: list[tuple[int, int, _QueuedRequest]] = []
+        self._sequence = itertools.count()
+        self._queued_by_key: dict[Hashable, _QueuedRequest] = {}
+        self._in_flight = 0
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(not entry.future.done() for _, _, entry in self._heap)
+
+    async def submit(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        priority: RequestPriority = RequestPriority.POLL,
+        key: Hashable | None = None,
+    ) -> Any:
+        """Wait for a free slot, then return the result of ``send()``."""
+        entry = self._queued_by_key.get(key) if key is not None else None
+
+        if entry is not None:
+            entry.send = send
+            entry.waiters += 1
+            self.metrics.superseded_requests += 1
+        else:
+            entry = _QueuedRequest(
+                priority, key, send, asyncio.get_running_loop().create_future()
+            )
+            heapq.heappush(self._heap, (priority, next(self._sequence), entry))
+            if key is not None:
+                self._queued_by_key[key] = entry
+            self._dispatch()
+
+        try:
+            return await asyncio.shield(entry.future)
+        except asyncio.CancelledError:
+            entry.waiters -= 1
+            if not entry.waiters and not entry.sent:
+                # nobody waits for it any more, so it is skipped when its turn
+                # comes
+                if entry.key is not None:
+                    del self._queued_by_key[entry.key]
+                entry.future.cancel()
+            raise
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.max_in_flight and self._heap:
+            _, _, entry = heapq.heappop(self._heap)
+            if entry.future.done():
+                continue
+            if entry.key is not None:
+                del self._queued_by_key[entry.key]
+
+            entry.sent = True
+            self._in_flight += 1
+            self.metrics.record_queue_wait(
+                entry.priority.name.lower(), time.monotonic() - entry.queued_at
+            )
+
+            task = asyncio.create_task(self._send(entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, entry: _QueuedRequest) -> None:
+        try:
+            result = await entry.send()
+        except asyncio.CancelledError:
+            entry.future.cancel()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            if entry.waiters and not entry.future.done():
+                entry.future.set_exception(err)
+        else:
+            if not entry.future.done():
+                entry.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._dispatch()
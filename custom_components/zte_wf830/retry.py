@@ -0,0 +1,142 @@
+"""Retry policy and circuit breaker for requests to the WF830."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import random
+import time
+
+from .const import (
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    REBOOT_PROBE_INTERVAL,
+    REBOOT_PROBE_MAX_INTERVAL,
+    REBOOT_SHUTDOWN_TIMEOUT,
+    REBOOT_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceUnavailableError(Exception):
+    """The device did not answer within the retry policy."""
+
+
+class CircuitOpenError(DeviceUnavailableError):
+    """Requests are refused because the device is known to be down."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Capped exponential backoff with jitter.
+
+    ``jitter`` is the fraction of each delay that is randomised, so a value of
+    0.5 yields delays between half and the full backoff step.
+    """
+
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1)."""
+        step = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+        return step * random.uniform(1 - self.jitter, 1)
+
+
+@dataclass(frozen=True)
+class RebootPolicy:
+    """How a rebooting device is watched until it answers again.
+
+    Probes are spaced by ``backoff``. A device still answering
+    ``shutdown_timeout`` seconds after the reboot command is assumed to have
+    ignored it, and one that is not back after ``timeout`` seconds is left to
+    the regular polling.
+    """
+
+    backoff: RetryPolicy = field(
+        default_factory=lambda: RetryPolicy(
+            base_delay=REBOOT_PROBE_INTERVAL, max_delay=REBOOT_PROBE_MAX_INTERVAL
+        )
+    )
+    shutdown_timeout: float = REBOOT_SHUTDOWN_TIMEOUT
+    timeout: float = REBOOT_TIMEOUT
+
+
+class CircuitBreaker:
+    """Fails fast while the device is down.
+
+    After ``failure_threshold`` consecutive failed calls the circuit opens and
+    every call is refused for ``reset_timeout`` seconds. Then a single trial
+    call is let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go to the device now.
+
+        Returns whether the call is the trial call, which must be ended with
+        ``record_success``, ``record_failure`` or ``end_trial``.
+        """
+        if self._opened_at is None:
+            return False
+
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError("Device marked as unavailable, not retrying yet")
+        if self._trial_in_progress:
+            raise CircuitOpenError("Waiting for the device to come back")
+
+        self._trial_in_progress = True
+        return True
+
+    def end_trial(self) -> None:
+        """Let another call through after a trial that ended without a result."""
+        self._trial_in_progress = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info("Device is reachable again, closing circuit")
+
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_progress = False
+
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Device failed %s consecutive calls, opening circuit for %ss",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Close the circuit without waiting for a successful call."""
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
@@ -0,0 +1,79 @@
+"""Adaptive polling intervals for the ZTE WF830 integration."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+INTERVAL_GROWTH = 1.5
+INTERVAL_SHRINK = 0.5
+
+
+class AdaptivePollScheduler(Generic[_KeyT]):
+    """Tracks how often each polled value changes and spaces its polls to match.
+
+    Every key starts at ``min_interval``. Each time a key is observed with the
+    same value as before its interval grows by ``INTERVAL_GROWTH``, up to
+    ``max_interval``; each time the value changed it shrinks by
+    ``INTERVAL_SHRINK``, down to ``min_interval``. Volatile values therefore
+    stay at the fastest rate while stable ones drift towards the slowest.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[_KeyT],
+        min_interval: float,
+        max_interval: float,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+
+        self._interval: dict[_KeyT, float] = {}
+        self._next_due: dict[_KeyT, float] = {}
+        self._last_value: dict[_KeyT, Any] = {}
+
+        self.add(keys)
+
+    def add(self, keys: Iterable[_KeyT]) -> None:
+        """Start tracking keys; they are due on the next poll."""
+        for key in keys:
+            self._interval.setdefault(key, self.min_interval)
+            self._next_due.setdefault(key, 0)
+
+    def reset(self, keys: Iterable[_KeyT]) -> None:
+        """Poll keys on the next tick and go back to the fastest rate."""
+        for key in keys:
+            self._interval[key] = self.min_interval
+            self._next_due[key] = 0
+
+    def due(self, now: float) -> list[_KeyT]:
+        return [key for key, due_at in self._next_due.items() if due_at <= now]
+
+    def observe(self, key: _KeyT, value: Any, now: float) -> None:
+        """Record a freshly polled value and schedule the key's next poll."""
+        interval = self._interval[key]
+
+        if key not in self._last_value:
+            pass
+        elif self._last_value[key] != value:
+            interval = max(self.min_interval, interval * INTERVAL_SHRINK)
+        else:
+            interval = min(self.max_interval, interval * INTERVAL_GROWTH)
+
+        self._last_value[key] = value
+        self._interval[key] = interval
+        self._next_due[key] = now + interval
+
+    def next_delay(self, now: float) -> float:
+        """Seconds until the earliest key is due, within the interval bounds."""
+        if not self._next_due:
+            return self.max_interval
+
+        delay = min(self._next_due.values()) - now
+
+        return min(self.max_interval, max(self.min_interval, delay))
+
+    def intervals(self) -> dict[_KeyT, float]:
+        return dict(self._interval)
@@ -3,44 +3,43 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import timedelta
+from functools import partial
 import logging
 
-# pylint: disable=no-name-in-module
-from pydantic import BaseModel
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
 
-from .api import SignalParams, TransferStatus, ZteWf830ApiClient
-from .const import DEVICE_NAME, DOMAIN
+from .api import DeviceSnapshot
+from .const import (
+    CONF_EXTRA_SENSORS,
+    CONF_TRANSFER_SIGNIFICANCE,
+    DEFAULT_TRANSFER_SIGNIFICANCE,
+    DEVICE_NAME,
+    DOMAIN,
+)
+from .coordinator import ZteDeviceUpdateCoordinator
+from .discovery import parse_list_item_key
+from .entity import ZteCoordinatorEntity
+from .history import MetricHistory
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     add_entities: AddEntitiesCallback,
 ) -> None:
-    api_client: ZteWf830ApiClient = hass.data[DOMAIN][entry.entry_id]
-
-    coordinator = ZteSensorUpdateCoordinator(hass, api_client, SCAN_INTERVAL)
+    coordinator: ZteDeviceUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    await coordinator.async_config_entry_first_refresh()
-
-    device_serial_number = await hass.async_add_executor_job(
-        api_client.get_serial_number
+    # stored by the config flow, so no request is needed before adding entities
+    device_serial_number = entry.unique_id
+    assert device_serial_number is not None
+    transfer_significance = entry.options.get(
+        CONF_TRANSFER_SIGNIFICANCE, DEFAULT_TRANSFER_SIGNIFICANCE
     )
 
     add_entities(
@@ -51,6 +50,7 @@ async def async_setup_entry(
                 coordinator,
                 lambda data: data.transfer_status.current_download // 1024,
                 "KB/s",
+                transfer_significance,
             ),
             ZteSensor(
                 device_serial_number,
@@ -58,6 +58,39 @@ async def async_setup_entry(
                 coordinator,
                 lambda data: data.transfer_status.current_upload // 1024,
                 "KB/s",
+                transfer_significance,
+            ),
+            ZteSensor(
+                device_serial_number,
+                "Download Rate",
+                coordinator,
+                lambda _: _kb_per_second(coordinator.download_meter.ewma),
+                "KB/s",
+                transfer_significance,
+            ),
+            ZteSensor(
+                device_serial_number,
+                "Upload Rate",
+                coordinator,
+                lambda _: _kb_per_second(coordinator.upload_meter.ewma),
+                "KB/s",
+                transfer_significance,
+            ),
+            ZteSensor(
+                device_serial_number,
+                "Average Download Rate",
+                coordinator,
+                lambda _: _kb_per_second(coordinator.download_meter.window_average),
+                "KB/s",
+                transfer_significance,
+            ),
+            ZteSensor(
+                device_serial_number,
+                "Average Upload Rate",
+                coordinator,
+                lambda _: _kb_per_second(coordinator.upload_meter.window_average),
+                "KB/s",
+                transfer_significance,
             ),
             ZteSensor(
                 device_serial_number,
@@ -90,65 +123,177 @@ async def async_setup_entry(
         ]
     )
 
+    add_entities(_signal_metric_sensors(device_serial_number, coordinator))
+    add_entities(_diagnostic_sensors(device_serial_number, coordinator))
+    add_entities(
+        _extra_sensors(
+            device_serial_number,
+            coordinator,
+            entry.options.get(CONF_EXTRA_SENSORS, []),
+        )
+    )
 
-class ZteSensorUpdateCoordinatorData(BaseModel):
-    signal_params: SignalParams
-    transfer_status: TransferStatus
 
+# label and unit of every signal metric kept in the coordinator's history
+SIGNAL_METRICS: dict[str, tuple[str, str]] = {
+    "rsrp0": ("RSRP0", "dBm"),
+    "rsrp1": ("RSRP1", "dBm"),
+    "rsrq": ("RSRQ", "dB"),
+    "sinr": ("SINR", "dB"),
+}
+# statistic name, WindowStats field, enabled by default
+SIGNAL_STATS: list[tuple[str, str, bool]] = [
+    ("Mean", "mean", True),
+    ("Min", "min", False),
+    ("Max", "max", False),
+    ("P10", "p10", False),
+]
 
-class ZteSensorUpdateCoordinator(DataUpdateCoordinator):
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        api_client: ZteWf830ApiClient,
-        update_interval: timedelta,
-    ) -> None:
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="ZTE WF830",
-            update_interval=update_interval,
-        )
 
-        self.api_client = api_client
+def _signal_metric_sensors(
+    device_id: str, coordinator: ZteDeviceUpdateCoordinator
+) -> list[ZteSensor]:
+    """Current value plus windowed statistics for every signal metric."""
+    sensors = []
 
-    async def _async_update_data(self) -> ZteSensorUpdateCoordinatorData:
-        try:
-            signal_params = await self.hass.async_add_executor_job(
-                self.api_client.get_signal_params,
+    for metric, (label, unit) in SIGNAL_METRICS.items():
+        history = coordinator.signal_history[metric]
+
+        sensors.append(
+            ZteSensor(
+                device_id,
+                label,
+                coordinator,
+                lambda data, metric=metric: getattr(data.signal_params, metric),
+                unit,
             )
-            transfer_status = await self.hass.async_add_executor_job(
-                self.api_client.get_transfer_status
+        )
+        sensors.extend(
+            ZteSensor(
+                device_id,
+                f"{label} {stat_name}",
+                coordinator,
+                lambda _, history=history, field=field: _window_stat(history, field),
+                unit,
+                enabled_default=enabled_default,
             )
+            for stat_name, field, enabled_default in SIGNAL_STATS
+        )
+
+    return sensors
+
 
-        except Exception as err:
-            raise UpdateFailed(
-                f"Communication with API failed: {type(err)}, {err}"
-            ) from err
+def _diagnostic_sensors(
+    device_id: str, coordinator: ZteDeviceUpdateCoordinator
+) -> list[ZteSensor]:
+    """Request metrics of the API client, disabled unless enabled by hand."""
+    metrics = coordinator.api_client.metrics
+    # name, value, unit
+    diagnostics: list[tuple[str, Callable[[], float | int | None], str]] = [
+        ("Poll Duration", lambda: _ms(coordinator.poll_duration.last), "ms"),
+        ("Requests", lambda: metrics.total_requests, ""),
+        ("Request Errors", lambda: metrics.total_errors, ""),
+        ("Request Retries", lambda: metrics.total_retries, ""),
+        ("Re-authentications", lambda: metrics.reauthentications, ""),
+        ("Data Received", lambda: metrics.bytes_received // 1024, "KB"),
+    ]
 
-        return ZteSensorUpdateCoordinatorData(
-            signal_params=signal_params,
-            transfer_status=transfer_status,
+    return [
+        ZteSensor(
+            device_id,
+            name,
+            coordinator,
+            lambda _, value=value: value(),
+            unit,
+            enabled_default=False,
+            entity_category=EntityCategory.DIAGNOSTIC,
         )
+        for name, value, unit in diagnostics
+    ]
 
 
-class ZteSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Sensor."""
+def _extra_sensors(
+    device_id: str, coordinator: ZteDeviceUpdateCoordinator, keys: list[str]
+) -> list[ZteSensor]:
+    """Sensors for the discovered nodes and list items picked in the options."""
+    sensors = []
+
+    for key in keys:
+        if (list_item := parse_list_item_key(key)) is None:
+            name = f"Node {key}"
+            read = partial(coordinator.node_value, key)
+        else:
+            list_id, entry, item = list_item
+            name = f"List {list_id} Entry {entry} {item}"
+            read = partial(coordinator.list_item_value, list_id, entry, item)
+
+        sensors.append(
+            ZteSensor(
+                device_id,
+                name,
+                coordinator,
+                lambda _, read=read: _numeric(read()),
+                "",
+            )
+        )
+
+    return sensors
+
+
+def _numeric(value: str | None) -> str | int | float | None:
+    """Numbers as numbers so they get history graphs, anything else as is."""
+    if value is None:
+        return None
+    for number_type in (int, float):
+        try:
+            return number_type(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def _window_stat(history: MetricHistory, field: str) -> float | None:
+    if (stats := history.stats()) is None:
+        return None
+    return round(getattr(stats, field), 1)
+
+
+def _kb_per_second(rate: float | None) -> float | None:
+    return None if rate is None else round(rate / 1024, 1)
+
+
+class ZteSensor(ZteCoordinatorEntity, SensorEntity):
+    """Representation of a Sensor.
+
+    Numeric values are only written once they moved by at least
+    ``significance`` from the last written value; 0 writes every change.
+    """
 
     def __init__(
         self,
         device_id: str,
         name: str,
-        coordinator: DataUpdateCoordinator,
-        extract_state: Callable[[ZteSensorUpdateCoordinatorData], str | int],
+        coordinator: ZteDeviceUpdateCoordinator,
+        extract_state: Callable[[DeviceSnapshot], str | int | float | None],
         unit: str,
+        significance: float = 0,
+        enabled_default: bool = True,
+        entity_category: EntityCategory | None = None,
     ) -> None:
         super().__init__(coordinator)
 
         self._attr_name = f"{DEVICE_NAME} {device_id} {name}"
         self._attr_unique_id = f"{device_id}_{name.lower().replace(' ', '_')}"
-        self._attr_native_unit_of_measurement = unit
+        # HA treats any unit, even an empty one, as a numeric sensor
+        self._attr_native_unit_of_measurement = unit or None
+        self._attr_entity_registry_enabled_default = enabled_default
+        self._attr_entity_category = entity_category
         self.extract_state = extract_state
+        self.significance = significance
 
         self.device_id = device_id
 
@@ -158,17 +303,33 @@ class ZteSensor(CoordinatorEntity, SensorEntity):
         return DeviceInfo(
             identifiers={(DOMAIN, self.device_id)},
             name=DEVICE_NAME,
-            default_manufacturer="ZTE",
-            default_model="WF830",
+            manufacturer="ZTE",
+            model="WF830",
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        fetched_data: ZteSensorUpdateCoordinatorData = self.coordinator.data
+        fetched_data = self.coordinator.data
 
         if not fetched_data:
             return
 
-        self._attr_native_value = self.extract_state(fetched_data)
+        value = self.extract_state(fetched_data)
+        changed = self._is_significant_change(value)
+
+        if changed:
+            self._attr_native_value = value
+
+        self._async_write_ha_state_if(changed)
+
+    def _is_significant_change(self, value: str | int | float | None) -> bool:
+        last_value = self._attr_native_value
+
+        if (
+            self.significance
+            and isinstance(value, (int, float))
+            and isinstance(last_value, (int, float))
+        ):
+            return abs(value - last_value) >= self.significance
 
-        self.async_write_ha_state()
+        return value != last_value
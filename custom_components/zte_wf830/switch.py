@@ -2,46 +2,62 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
-# pylint: disable=no-name-in-module
-from pydantic import BaseModel
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .api import LteBand, ZteNode
+from .band_optimizer import BandOptimizer
+from .const import (
+    CONF_AUTO_BAND_INTERVAL,
+    DEFAULT_AUTO_BAND_INTERVAL,
+    DEFAULT_LTE_BANDS,
+    DEVICE_NAME,
+    DOMAIN,
 )
-
-from .api import LteBand, ZteWf830ApiClient
-from .const import DEVICE_NAME, DOMAIN
+from .coordinator import ZteDeviceUpdateCoordinator
+from .entity import ZteCoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=10)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     add_entities: AddEntitiesCallback,
 ) -> None:
-    api_client: ZteWf830ApiClient = hass.data[DOMAIN][entry.entry_id]
+    coordinator: ZteDeviceUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    coordinator = ZteSwitchUpdateCoordinator(hass, api_client, SCAN_INTERVAL)
+    # stored by the config flow, so no request is needed before adding entities
+    device_serial_number = entry.unique_id
+    assert device_serial_number is not None
 
-    await coordinator.async_config_entry_first_refresh()
-
-    device_serial_number = await hass.async_add_executor_job(
-        api_client.get_serial_number
-    )
+    # The stock bands, the ones that had a switch before and the active ones.
+    # Bands the device reports later get their switch when they show up.
+    bands = {LteBand.get_from_band_index(number) for number in DEFAULT_LTE_BANDS}
+    for registry_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry.entry_id
+    ):
+        if registry_entry.domain == "switch" and (
+            band := LteBand.__members__.get(
+                registry_entry.unique_id.removeprefix(f"{device_serial_number}_")
+            )
+        ):
+            bands.add(band)
+    if coordinator.data is not None:
+        bands.update(coordinator.data.active_bands)
 
     add_entities(
         [
@@ -50,55 +66,53 @@ async def async_setup_entry(
                 band,
                 coordinator,
             )
-            for band in LteBand
+            for band in LteBand.from_mask(LteBand.to_mask(bands))
         ]
     )
 
+    @callback
+    def add_reported_bands() -> None:
+        if coordinator.data is None:
+            return
 
-class ZteSwitchUpdateCoordinatorData(BaseModel):
-    active_bands: list[LteBand]
-
-
-class ZteSwitchUpdateCoordinator(DataUpdateCoordinator):
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        api_client: ZteWf830ApiClient,
-        update_interval: timedelta,
-    ):
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="ZTE WF830",
-            update_interval=update_interval,
-        )
-
-        self.api_client = api_client
-
-    async def _async_update_data(self) -> ZteSwitchUpdateCoordinatorData:
-        try:
-            active_bands = await self.hass.async_add_executor_job(
-                self.api_client.get_active_bands
+        new_bands = [
+            band for band in coordinator.data.active_bands if band not in bands
+        ]
+        if new_bands:
+            bands.update(new_bands)
+            add_entities(
+                [
+                    ZteBandSwitch(device_serial_number, band, coordinator)
+                    for band in new_bands
+                ]
             )
 
-        except Exception as err:
-            raise UpdateFailed(
-                f"Communication with API failed: {type(err)}, {err}"
-            ) from err
+    entry.async_on_unload(coordinator.async_add_listener(add_reported_bands))
 
-        return ZteSwitchUpdateCoordinatorData(
-            active_bands=active_bands,
-        )
+    add_entities(
+        [
+            ZteAutoBandSwitch(
+                device_serial_number,
+                coordinator,
+                bands,
+                timedelta(
+                    hours=entry.options.get(
+                        CONF_AUTO_BAND_INTERVAL, DEFAULT_AUTO_BAND_INTERVAL
+                    )
+                ),
+            )
+        ]
+    )
 
 
-class ZteBandSwitch(CoordinatorEntity[ZteSwitchUpdateCoordinator], SwitchEntity):
+class ZteBandSwitch(ZteCoordinatorEntity, SwitchEntity):
     """Representation of a Switch."""
 
     def __init__(
         self,
         device_id: str,
         bound_band: LteBand,
-        coordinator: ZteSwitchUpdateCoordinator,
+        coordinator: ZteDeviceUpdateCoordinator,
     ) -> None:
         super().__init__(coordinator)
 
@@ -114,24 +128,151 @@ class ZteBandSwitch(CoordinatorEntity[ZteSwitchUpdateCoordinator], SwitchEntity)
         return DeviceInfo(
             identifiers={(DOMAIN, self.device_id)},
             name=DEVICE_NAME,
-            default_manufacturer="ZTE",
-            default_model="WF830",
+            manufacturer="ZTE",
+            model="WF830",
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        fetched_data: ZteSwitchUpdateCoordinatorData = self.coordinator.data
+        fetched_data = self.coordinator.data
 
         if not fetched_data:
             return
 
-        self._attr_is_on = self.bound_band in fetched_data.active_bands
+        is_on = self.bound_band in fetched_data.active_bands
+        changed = is_on != self._attr_is_on
 
-        self.async_write_ha_state()
+        self._attr_is_on = is_on
+
+        self._async_write_ha_state_if(changed)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        self.coordinator.async_set_band_enabled(self.bound_band, True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        self.coordinator.async_set_band_enabled(self.bound_band, False)
+
+
+class ZteAutoBandSwitch(SwitchEntity, RestoreEntity):
+    """Auto band mode: benchmarks every band with a switch and pins the best one.
+
+    Turning the switch on runs an evaluation right away and then again every
+    ``interval``. The state survives restarts; after a restart the next
+    evaluation waits for the interval instead of running at boot.
+    """
+
+    _attr_icon = "mdi:antenna"
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        device_id: str,
+        coordinator: ZteDeviceUpdateCoordinator,
+        bands: set[LteBand],
+        interval: timedelta,
+    ) -> None:
+        super().__init__()
+
+        self._attr_name = f"{DEVICE_NAME} {device_id} Auto Band"
+        self._attr_unique_id = f"{device_id}_auto_band"
+        self._attr_is_on = False
+
+        self.coordinator = coordinator
+        self.optimizer = BandOptimizer(
+            coordinator.api_client, band_lock=coordinator.band_lock
+        )
+        # the bands with a switch, evaluated in ascending order
+        self.bands = bands
+        self.interval = interval
+
+        self.device_id = device_id
+
+        self._unsub_interval: Callable[[], None] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        assert self.unique_id
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.device_id)},
+            name=DEVICE_NAME,
+            manufacturer="ZTE",
+            model="WF830",
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {
+            "evaluating": self.optimizer.running,
+            "scores": {
+                measurement.band.name: round(measurement.score, 3)
+                for measurement in self.optimizer.last_results
+            },
+        }
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        if (last_state := await self.async_get_last_state()) is not None:
+            if last_state.state == STATE_ON:
+                self._attr_is_on = True
+                self._schedule()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.api_client.set_band, self.bound_band
+        self._attr_is_on = True
+        self._schedule()
+        self._start_evaluation()
+
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        self._attr_is_on = False
+        self._cancel()
+
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule(self) -> None:
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self.hass, self._interval_elapsed, self.interval
+            )
+
+    @callback
+    def _cancel(self) -> None:
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _interval_elapsed(self, now: datetime) -> None:
+        self._start_evaluation()
+
+    @callback
+    def _start_evaluation(self) -> None:
+        if self.optimizer.running:
+            return
+
+        self._task = self.hass.async_create_background_task(
+            self._async_evaluate(), name=f"{DOMAIN} band evaluation"
         )
 
-        await self.coordinator._async_update_data()
+    async def _async_evaluate(self) -> None:
+        self.async_write_ha_state()
+        try:
+            await self.optimizer.async_optimize(
+                LteBand.from_mask(LteBand.to_mask(self.bands))
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Band evaluation failed")
+        finally:
+            self._task = None
+
+        self.async_write_ha_state()
+        await self.coordinator.async_refresh_nodes([ZteNode.GET_ACTIVE_BANDS])
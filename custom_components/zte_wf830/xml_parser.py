@@ -0,0 +1,70 @@
+"""Parsers for the WF830 ``_request.xml`` responses.
+
+The router answers polls with two flat shapes::
+
+    <data><N_8_49>3;</N_8_49><N_3_45>10.0.0.2;</N_3_45></data>
+    <data><list><L_1>123</L_1><L_5>45</L_5></list><list>...</list></data>
+
+Those are matched with precompiled patterns and read straight into the
+result. Anything else, including the HTML page served once the session has
+expired, goes through xmltodict, which keeps raising ExpatError for non-XML
+payloads.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+from xml.sax.saxutils import unescape
+
+import xmltodict
+
+_PROLOG = rb"\s*(?:<\?xml[^>]*\?>\s*)?"
+
+_NODE_DATA_RE = re.compile(
+    _PROLOG + rb"<data>(?:\s*<(N_\d+_\d+)>[^<]*</\1>)*\s*</data>\s*"
+)
+_NODE_RE = re.compile(rb"<(N_\d+_\d+)>([^<]*)</\1>")
+
+_LIST_DATA_RE = re.compile(
+    _PROLOG
+    + rb"<data>(?:\s*<list>(?:\s*<(L_\d+)>[^<]*</\1>)*\s*</list>)*\s*</data>\s*"
+)
+_LIST_RE = re.compile(rb"<list>(.*?)</list>", re.DOTALL)
+_LIST_ITEM_RE = re.compile(rb"<(L_\d+)>([^<]*)</\1>")
+
+
+def _text(raw: bytes) -> str:
+    text = raw.decode()
+    if "&" in text:
+        text = unescape(text, {"&quot;": '"', "&apos;": "'"})
+    return text.strip()
+
+
+def parse_node_values(content: bytes) -> dict[str, str]:
+    """Map node ids to values of a NODE_GET response, trailing ``;`` removed."""
+    if _NODE_DATA_RE.fullmatch(content):
+        return {
+            tag.decode(): _text(value).strip(";")
+            for tag, value in _NODE_RE.findall(content)
+        }
+
+    tag_values: dict[str, Any] = xmltodict.parse(content)["data"] or {}
+
+    return {tag: (value or "").strip(";") for tag, value in tag_values.items()}
+
+
+def parse_lists(content: bytes) -> list[dict[str, str]]:
+    """Return the entries of a LIST_FULL response, one dict per ``<list>``."""
+    if _LIST_DATA_RE.fullmatch(content):
+        return [
+            {tag.decode(): _text(value) for tag, value in _LIST_ITEM_RE.findall(body)}
+            for body in _LIST_RE.findall(content)
+        ]
+
+    data: dict[str, Any] = xmltodict.parse(content, force_list=("list",))["data"]
+
+    return [
+        {tag: value or "" for tag, value in entry.items()}
+        for entry in (data or {}).get("list", [])
+    ]
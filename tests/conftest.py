@@ -0,0 +1,150 @@
+"""Fixtures running the client against a local mock router.
+
+pytest-benchmark times plain functions, so the fixtures own an event loop
+and ``run`` drives a coroutine to completion on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, TypeVar
+
+import aiohttp
+import pytest
+
+from custom_components.zte_wf830.api import AsyncZteWf830ApiClient
+from custom_components.zte_wf830.retry import RetryPolicy
+
+from .mock_router import PASSWORD, MockRouter
+
+T = TypeVar("T")
+
+# Rounds per network benchmark; each one is a real round-trip to the mock.
+ROUNDS = 50
+
+SERIAL_NUMBER = "ZTE0123456789"
+
+Runner = Callable[[Awaitable[T]], T]
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+    event_loop.close()
+
+
+@pytest.fixture
+def run(loop: asyncio.AbstractEventLoop) -> Runner:
+    return loop.run_until_complete
+
+
+@pytest.fixture
+def bench(benchmark, run: Runner) -> Callable[..., int]:
+    """Time ``run(make_coro())`` and return how many rounds were run.
+
+    Request counts are asserted per round, and with ``--benchmark-disable``
+    the target runs only once.
+    """
+
+    def measure(
+        make_coro: Callable[[], Awaitable[Any]],
+        setup: Callable[[], None] | None = None,
+        rounds: int = ROUNDS,
+    ) -> int:
+        count = 0
+
+        def target() -> None:
+            nonlocal count
+            count += 1
+            run(make_coro())
+
+        benchmark.pedantic(target, setup=setup, rounds=rounds)
+        return count
+
+    return measure
+
+
+@pytest.fixture
+def router(run: Runner, socket_enabled: None) -> Iterator[MockRouter]:
+    router = MockRouter()
+    run(router.start())
+    yield router
+    run(router.stop())
+
+
+@pytest.fixture
+def session(run: Runner) -> Iterator[aiohttp.ClientSession]:
+    async def create() -> aiohttp.ClientSession:
+        return aiohttp.ClientSession()
+
+    session = run(create())
+    yield session
+    run(session.close())
+
+
+@pytest.fixture
+def make_client(
+    router: MockRouter, session: aiohttp.ClientSession
+) -> Callable[..., AsyncZteWf830ApiClient]:
+    """Build clients for the mock router, with short retry delays by default."""
+
+    def make(**kwargs: Any) -> AsyncZteWf830ApiClient:
+        kwargs.setdefault(
+            "retry_policy", RetryPolicy(base_delay=0.01, max_delay=0.05)
+        )
+        return AsyncZteWf830ApiClient(router.host, PASSWORD, session, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def client(
+    make_client: Callable[..., AsyncZteWf830ApiClient],
+) -> AsyncZteWf830ApiClient:
+    return make_client()
+
+
+@pytest.fixture
+def bare_hass(run: Runner, tmp_path) -> Iterator[Any]:
+    """A bare Home Assistant core, enough to run the coordinator.
+
+    Tests setting up config entries use the plugin's ``hass`` fixture, with
+    ``hass_router``, instead.
+    """
+    from homeassistant.core import HomeAssistant
+
+    async def create() -> HomeAssistant:
+        return HomeAssistant(str(tmp_path))
+
+    hass = run(create())
+    yield hass
+    run(hass.async_stop(force=True))
+
+
+@pytest.fixture
+async def hass_router(socket_enabled: None) -> AsyncIterator[MockRouter]:
+    """The mock router, on the event loop of the plugin's ``hass`` fixture."""
+    router = MockRouter()
+    await router.start()
+    yield router
+    await router.stop()
+
+
+@pytest.fixture
+def config_entry(hass: Any, hass_router: MockRouter) -> Any:
+    """A config entry for ``hass_router``, added to ``hass`` but not set up."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.zte_wf830.const import DEVICE_NAME, DOMAIN
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=DEVICE_NAME,
+        data={"host": hass_router.host, "smartadmin_password": PASSWORD},
+        unique_id=SERIAL_NUMBER,
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,255 @@
+"""Local stand-in for the WF830 web interface.
+
+Implements ``/action/login`` and the ``_request.xml`` commands the client
+uses (NODE_GET, NODEM_SET, NODE_SET and LIST_FULL) on top of aiohttp's web
+server. Latency, session expiry and dropped connections are configurable so
+the client's batching and retry paths can be exercised without a router.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import secrets
+import time
+
+from aiohttp import web
+
+PASSWORD = "smartadmin"
+TOKEN_COOKIE_NAME = "-goahead-session-"
+
+# What the router serves instead of XML once the session is gone.
+LOGIN_PAGE = (
+    "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+    "<title>Login</title></head><body></body></html>"
+)
+
+DEFAULT_NODES: dict[str, str] = {
+    "N_8_49": "3;",
+    "N_8_45": "LTE;",
+    "N_8_25": "-95;",
+    "N_8_26": "-97;",
+    "N_8_22": "-11;",
+    "N_8_35": "12;",
+    "N_8_46": "connected;",
+    "N_3_45": "10.1.2.3;",
+    "N_5_58": "2048;",
+    "N_5_61": "1024;",
+    "N_5_54": "ZTE0123456789;",
+    "N_8_38": "1;3;",
+}
+# LIST_FULL lists besides list 0, which holds the transfer counters
+DEFAULT_LISTS: dict[str, list[dict[str, str]]] = {
+    "2": [
+        {"L_1": "LAN", "L_2": "192.168.0.1"},
+        {"L_1": "WLAN", "L_2": "192.168.1.1"},
+    ],
+}
+
+
+class MockRouter:
+    """Configurable fake WF830.
+
+    ``latency`` delays every ``_request.xml`` answer, ``session_lifetime``
+    drops sessions that stay idle for longer, and ``drop_next(count)`` closes
+    the connection on the next ``count`` requests without answering. With
+    ``ignore_writes`` set, writes are acknowledged but not applied. A reboot
+    closes the connection of the write that triggered it and every one after
+    for ``boot_time`` seconds.
+    ``requests`` counts the handled requests per command, including logins,
+    ``log`` lists them in the order they arrived as ``cmd`` or ``cmd:node``, and
+    ``peak_concurrency`` is the most requests that were ever handled at once.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        session_lifetime: float | None = None,
+        password: str = PASSWORD,
+        boot_time: float = 0.0,
+    ) -> None:
+        self.latency = latency
+        self.session_lifetime = session_lifetime
+        self.password = password
+        self.boot_time = boot_time
+        self.ignore_writes = False
+
+        self.nodes = dict(DEFAULT_NODES)
+        self.lists = {key: list(entries) for key, entries in DEFAULT_LISTS.items()}
+        self.total_download = 10**9
+        self.total_upload = 10**8
+        self.requests: Counter[str] = Counter()
+        self.log: list[str] = []
+        self.peak_concurrency = 0
+        self.rebooted = False
+
+        # session token -> time of its last request
+        self._sessions: dict[str, float] = {}
+        self._drop_count = 0
+        self._active = 0
+        self._down_until = 0.0
+        self._runner: web.AppRunner | None = None
+        self.host = ""
+
+    async def start(self) -> str:
+        """Listen on a free local port and return ``host:port``."""
+        app = web.Application()
+        app.router.add_get("/", self._handle_index)
+        app.router.add_post("/action/login", self._handle_login)
+        app.router.add_get("/_request.xml", self._handle_request)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.host = f"127.0.0.1:{port}"
+
+        return self.host
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def drop_next(self, count: int = 1) -> None:
+        self._drop_count += count
+
+    def expire_sessions(self) -> None:
+        self._sessions.clear()
+
+    def reset_counters(self) -> None:
+        self.requests.clear()
+        self.log.clear()
+        self.peak_concurrency = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    @property
+    def booting(self) -> bool:
+        return time.monotonic() < self._down_until
+
+    async def _handle_index(self, request: web.Request) -> web.StreamResponse:
+        self.requests["index"] += 1
+        if self.booting:
+            return self._drop(request)
+        return web.Response(text=LOGIN_PAGE, content_type="text/html")
+
+    async def _handle_login(self, request: web.Request) -> web.StreamResponse:
+        self.requests["login"] += 1
+        if self.booting:
+            return self._drop(request)
+        data = await request.post()
+
+        if data.get("password") != self.password:
+            return web.Response(text="<html><script>errString</script></html>")
+
+        token = secrets.token_hex(16)
+        self._sessions[token] = time.monotonic()
+
+        response = web.Response(text="<html></html>")
+        response.set_cookie(TOKEN_COOKIE_NAME, token)
+        return response
+
+    async def _handle_request(self, request: web.Request) -> web.StreamResponse:
+        command = request.query.get("cmd", "")
+        self.requests[command] += 1
+        target = request.query.get("node", request.query.get("list"))
+        self.log.append(f"{command}:{target}" if target else command)
+
+        self._active += 1
+        self.peak_concurrency = max(self.peak_concurrency, self._active)
+        try:
+            return await self._respond(request, command)
+        finally:
+            self._active -= 1
+
+    async def _respond(self, request: web.Request, command: str) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.booting:
+            return self._drop(request)
+        if self._drop_count:
+            self._drop_count -= 1
+            return self._drop(request)
+
+        if not self._check_session(request.cookies.get(TOKEN_COOKIE_NAME)):
+            return web.Response(text=LOGIN_PAGE, content_type="text/html")
+
+        if command == "OAM_MIDWARE_NODE_GET":
+            return self._xml(self._node_get(request.query["node"]))
+        if command == "OAM_MIDWARE_LIST_FULL":
+            return self._xml(self._list_full(request.query.get("list", "0")))
+        if command in ("OAM_MIDWARE_NODEM_SET", "OAM_MIDWARE_NODE_SET"):
+            if not self.ignore_writes:
+                self._node_set(request.query["node"], request.query["value"])
+            if self.booting:
+                # goes down before answering the write that rebooted it
+                return self._drop(request)
+            return self._xml("<result>SUCCESS</result>")
+
+        return web.Response(status=400)
+
+    @staticmethod
+    def _drop(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        request.transport.close()
+        return web.Response()
+
+    def _check_session(self, token: str | None) -> bool:
+        if token is None or token not in self._sessions:
+            return False
+
+        now = time.monotonic()
+        if (
+            self.session_lifetime is not None
+            and now - self._sessions[token] > self.session_lifetime
+        ):
+            del self._sessions[token]
+            return False
+
+        self._sessions[token] = now
+        return True
+
+    def _node_get(self, nodes: str) -> str:
+        return "".join(
+            f"<{node}>{self.nodes.get(node, '')}</{node}>" for node in nodes.split(";")
+        )
+
+    def _list_full(self, list_id: str) -> str:
+        if list_id != "0":
+            return "".join(
+                "<list>"
+                + "".join(f"<{item}>{value}</{item}>" for item, value in entry.items())
+                + "</list>"
+                for entry in self.lists.get(list_id, [])
+            )
+
+        # Some traffic between polls, so rates are never zero.
+        self.total_download += 40960
+        self.total_upload += 10240
+
+        return (
+            f"<list><L_1>{self.total_download}</L_1><L_5>{self.total_upload}</L_5>"
+            "</list><list><L_1>0</L_1><L_5>0</L_5></list>"
+        )
+
+    def _node_set(self, node: str, value: str) -> None:
+        if node == "N_8_36":
+            self.nodes["N_8_38"] = bytes.fromhex(value).decode("utf-16-be")
+        elif node == "N_5_67":
+            # the second of the two reboot writes triggers it
+            self.rebooted = True
+            self._sessions.clear()
+            self._down_until = time.monotonic() + self.boot_time
+
+    @staticmethod
+    def _xml(body: str) -> web.Response:
+        return web.Response(
+            text=f"<?xml version='1.0' encoding='utf-8'?><data>{body}</data>",
+            content_type="text/xml",
+        )
@@ -0,0 +1,74 @@
+"""Auto band evaluation against the mock router."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.zte_wf830.api import AsyncZteWf830ApiClient, LteBand
+from custom_components.zte_wf830.band_optimizer import BandOptimizer
+
+from .mock_router import MockRouter
+
+LATENCY = 0.005
+BANDS = [LteBand.BAND_1, LteBand.BAND_3, LteBand.BAND_20]
+
+
+@pytest.fixture
+def client(run, router: MockRouter, client: AsyncZteWf830ApiClient):
+    router.latency = LATENCY
+    run(client.authenticate())
+    router.reset_counters()
+    return client
+
+
+def test_optimize(bench, router: MockRouter, client) -> None:
+    """Each band is written and sampled, then the best one is pinned."""
+    optimizer = BandOptimizer(
+        client, settle_time=0, sample_count=2, sample_interval=0.01
+    )
+
+    rounds = bench(lambda: optimizer.async_optimize(BANDS), rounds=5)
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == (len(BANDS) + 1) * rounds
+    assert [m.band for m in optimizer.last_results] == BANDS
+    assert router.nodes["N_8_38"] in ("1;", "3;", "20;")
+
+
+def test_cancelled_run_restores_bands(run, router: MockRouter, client) -> None:
+    optimizer = BandOptimizer(client, settle_time=0.2)
+
+    async def cancel_run() -> None:
+        task = asyncio.create_task(optimizer.async_optimize(BANDS))
+        await asyncio.sleep(0.1)
+        assert router.nodes["N_8_38"] == "1;"
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(cancel_run())
+
+    assert router.nodes["N_8_38"] == "1;3;"
+    assert not optimizer.running
+
+
+def test_waits_for_band_changes(run, router: MockRouter, client) -> None:
+    """No band is written while another band change holds the lock."""
+    band_lock = asyncio.Lock()
+    optimizer = BandOptimizer(
+        client, settle_time=0, sample_count=1, band_lock=band_lock
+    )
+
+    async def optimize_during_change() -> None:
+        async with band_lock:
+            task = asyncio.create_task(optimizer.async_optimize(BANDS))
+            await asyncio.sleep(0.05)
+            assert optimizer.running
+            assert router.requests["OAM_MIDWARE_NODEM_SET"] == 0
+        await task
+
+    run(optimize_during_change())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == len(BANDS) + 1
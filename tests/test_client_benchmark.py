@@ -0,0 +1,199 @@
+"""Client round-trips against the mock router: latency, request counts, retries."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+import pytest
+
+from custom_components.zte_wf830.api import AsyncZteWf830ApiClient, LteBand
+from custom_components.zte_wf830.discovery import async_discover
+from custom_components.zte_wf830.retry import (
+    CircuitBreaker,
+    DeviceUnavailableError,
+    RetryPolicy,
+)
+
+from .mock_router import MockRouter
+
+# Small enough to keep the suite fast, large enough to dominate local overhead.
+LATENCY = 0.005
+
+
+@pytest.fixture
+def client(run, router: MockRouter, client: AsyncZteWf830ApiClient):
+    router.latency = LATENCY
+    run(client.authenticate())
+    router.reset_counters()
+    return client
+
+
+def test_snapshot(benchmark, bench, router: MockRouter, client) -> None:
+    """A full snapshot is one NODE_GET and one LIST_FULL, sent concurrently."""
+    rounds = bench(client.get_snapshot)
+
+    requests_per_poll = router.total_requests / rounds
+    benchmark.extra_info["requests_per_poll"] = requests_per_poll
+    assert requests_per_poll == 2
+
+
+def test_concurrent_reads_are_coalesced(
+    benchmark, bench, router: MockRouter, client
+) -> None:
+    async def poll() -> None:
+        await asyncio.gather(
+            client.get_signal_params(),
+            client.get_active_bands(),
+            client.get_serial_number(),
+        )
+
+    rounds = bench(poll)
+
+    requests_per_poll = router.requests["OAM_MIDWARE_NODE_GET"] / rounds
+    benchmark.extra_info["requests_per_poll"] = requests_per_poll
+    assert requests_per_poll == 1
+
+
+def test_abandoned_read_fails_quietly(run, loop, router: MockRouter, client) -> None:
+    """A merged read whose callers were all cancelled leaves no stray error."""
+    errors = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    async def abandon_read() -> None:
+        await router.stop()
+        read = asyncio.create_task(client.get_active_bands())
+        await asyncio.sleep(0)
+        read.cancel()
+        # the merged request is sent after the window and fails
+        await asyncio.sleep(0.1)
+
+    run(abandon_read())
+    gc.collect()
+
+    assert not errors
+
+
+def test_discovery(benchmark, run, router: MockRouter, client) -> None:
+    schema = benchmark.pedantic(lambda: run(async_discover(client)), rounds=5)
+
+    assert schema.nodes["N_8_38"] == "1;3"
+    assert "N_8_36" not in schema.nodes
+    assert set(schema.lists) == {0, 2}
+    assert schema.lists[2][1] == {"L_1": "WLAN", "L_2": "192.168.1.1"}
+    assert not client.metrics.nodes
+
+
+def test_polls_during_discovery_are_recorded(run, client) -> None:
+    async def discover_while_polling() -> int:
+        polls = 0
+        discovery = asyncio.create_task(async_discover(client))
+        while not discovery.done():
+            await client.get_active_bands()
+            polls += 1
+        await discovery
+        return polls
+
+    polls = run(discover_while_polling())
+
+    assert set(client.metrics.nodes) == {"N_8_38"}
+    assert client.metrics.nodes["N_8_38"].count == polls
+
+
+def test_resend_after_disconnect(bench, router: MockRouter, client) -> None:
+    """A single dropped connection is resent by aiohttp, without a backoff."""
+    rounds = bench(client.get_active_bands, setup=router.drop_next)
+
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == 2 * rounds
+    assert not client.metrics.retries
+    assert not client.circuit_breaker.is_open
+
+
+def test_retry_after_disconnect(bench, router: MockRouter, client) -> None:
+    """When aiohttp's resend is dropped too, the client backs off and retries."""
+    rounds = bench(client.get_active_bands, setup=lambda: router.drop_next(2))
+
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == 3 * rounds
+    assert client.metrics.retries["get_node_values"] == rounds
+    assert not client.circuit_breaker.is_open
+
+
+def test_relogin_after_session_expiry(bench, router: MockRouter, client) -> None:
+    """An expired session is detected from the login page and renewed once."""
+    rounds = bench(client.get_active_bands, setup=router.expire_sessions)
+
+    assert router.requests["login"] == rounds
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == 2 * rounds
+    assert client.metrics.expired_sessions == rounds
+    assert client.metrics.reauthentications == rounds
+
+
+def test_proactive_session_refresh(bench, router: MockRouter, make_client) -> None:
+    """A session about to expire is renewed before the request, not after.
+
+    With a lifetime shorter than the refresh margin every call renews the
+    session first, so the router never has to answer with its login page.
+    """
+    router.latency = LATENCY
+    router.session_lifetime = 1.0
+    client = make_client(session_lifetime=1.0)
+
+    rounds = bench(client.get_active_bands)
+
+    assert router.requests["login"] == rounds
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == rounds
+
+
+def test_unavailable_device_fails_fast(run, router: MockRouter, make_client) -> None:
+    # two calls, each dropped and then dropped again when aiohttp resends it
+    policy = RetryPolicy(max_attempts=4, base_delay=0.01, max_delay=0.01)
+    client = make_client(retry_policy=policy)
+    run(client.authenticate())
+    router.reset_counters()
+
+    breaker = client.circuit_breaker
+    for _ in range(breaker.failure_threshold):
+        router.drop_next(policy.max_attempts)
+        with pytest.raises(DeviceUnavailableError):
+            run(client.get_active_bands())
+
+    assert breaker.is_open
+    sent = router.requests["OAM_MIDWARE_NODE_GET"]
+    assert sent == policy.max_attempts * breaker.failure_threshold
+
+    with pytest.raises(DeviceUnavailableError):
+        run(client.get_active_bands())
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == sent
+
+
+def test_set_bands(bench, run, router: MockRouter, client) -> None:
+    """A selection is written in one request, in ascending band order."""
+    bands = [LteBand.BAND_20, LteBand.BAND_1]
+    rounds = bench(lambda: client.set_bands(bands))
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == rounds
+    assert router.nodes["N_8_38"] == "1;20;"
+    assert run(client.get_active_bands()) == [LteBand.BAND_1, LteBand.BAND_20]
+
+
+def test_cancelled_trial_call(run, router: MockRouter, make_client) -> None:
+    """Cancelling the call that tests an open circuit lets the next one try."""
+    client = make_client(circuit_breaker=CircuitBreaker(1, reset_timeout=0))
+    run(client.authenticate())
+    client.circuit_breaker.record_failure()
+    router.latency = 0.2
+
+    async def cancel_trial() -> None:
+        trial = asyncio.create_task(client.get_list(2))
+        await asyncio.sleep(0.1)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        # let the router finish the abandoned request
+        await asyncio.sleep(0.2)
+
+    run(cancel_trial())
+    router.latency = 0
+
+    assert run(client.get_list(2))[1]["L_1"] == "WLAN"
+    assert not client.circuit_breaker.is_open
@@ -0,0 +1,84 @@
+"""Standalone collector: polling into the metric template and scraping it."""
+
+from __future__ import annotations
+
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from custom_components.zte_wf830 import collector as collector_module
+from custom_components.zte_wf830.collector import Collector
+from custom_components.zte_wf830.retry import RetryPolicy
+
+from .mock_router import MockRouter
+
+LATENCY = 0.005
+
+
+@pytest.fixture
+def collector(run, router: MockRouter, client) -> Collector:
+    router.latency = LATENCY
+    run(client.authenticate())
+    router.reset_counters()
+    return Collector(client, interval=1)
+
+
+def test_poll(benchmark, bench, router: MockRouter, collector: Collector) -> None:
+    rounds = bench(collector.poll)
+
+    requests_per_poll = router.total_requests / rounds
+    benchmark.extra_info["requests_per_poll"] = requests_per_poll
+    assert requests_per_poll == 2
+
+    lines = collector.template.render().decode().splitlines()
+    host = collector.api_client.host
+    assert f'zte_wf830_rsrp0_dbm{{host="{host}"}} -95' in lines
+    assert f'zte_wf830_up{{host="{host}"}} 1' in lines
+    assert f'zte_wf830_band_active{{host="{host}",band="3"}} 1' in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_scrape(benchmark, run, collector: Collector) -> None:
+    """Scrapes between polls serve the body rendered after the last one."""
+    run(collector.poll())
+
+    body = benchmark(collector.template.render)
+
+    assert body is collector.template.render()
+    assert b"zte_wf830_download_bytes_total" in body
+
+
+def test_failed_poll(run, router: MockRouter, make_client) -> None:
+    policy = RetryPolicy(max_attempts=1)
+    collector = Collector(make_client(retry_policy=policy), interval=1)
+    run(collector.poll())
+
+    router.drop_next(2)
+    run(collector.poll())
+
+    lines = collector.template.render().decode().splitlines()
+    host = collector.api_client.host
+    assert f'zte_wf830_up{{host="{host}"}} 0' in lines
+    assert f'zte_wf830_failed_polls_total{{host="{host}"}} 1' in lines
+    assert not any(line.startswith("zte_wf830_rsrp0_dbm{") for line in lines)
+
+
+def test_script_runs_without_home_assistant() -> None:
+    """Run by its path, as documented, the collector never imports HA."""
+    script = pathlib.Path(collector_module.__file__)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script), "--help"],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=script.parents[2],
+    )
+
+    assert result.stdout.startswith("usage: collector.py")
+    # one line per imported module, ending in its name
+    imported = [line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()]
+    assert "custom_components.zte_wf830.api" in imported
+    assert not [name for name in imported if name.startswith("homeassistant")]
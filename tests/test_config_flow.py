@@ -0,0 +1,88 @@
+"""Config and options flows against the mock router."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+
+from custom_components.zte_wf830.const import (
+    CONF_AUTO_BAND_INTERVAL,
+    CONF_EXTRA_SENSORS,
+    CONF_MAX_IN_FLIGHT_REQUESTS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_TRANSFER_SIGNIFICANCE,
+)
+
+from .mock_router import MockRouter
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_reauth(
+    hass: HomeAssistant, hass_router: MockRouter, config_entry: MockConfigEntry
+) -> None:
+    hass_router.password = "changed"
+
+    result = await config_entry.start_reauth_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+    assert result["description_placeholders"]["host"] == hass_router.host
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"smartadmin_password": "wrong"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"smartadmin_password": "changed"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert config_entry.data == {
+        "host": hass_router.host,
+        "smartadmin_password": "changed",
+    }
+    assert config_entry.state is ConfigEntryState.LOADED
+
+
+async def test_options(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    options = {
+        CONF_MIN_POLL_INTERVAL: 30,
+        CONF_MAX_POLL_INTERVAL: 10,
+        CONF_TRANSFER_SIGNIFICANCE: 100,
+        CONF_AUTO_BAND_INTERVAL: 12,
+        CONF_MAX_IN_FLIGHT_REQUESTS: 4,
+    }
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    with pytest.raises(InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {**options, CONF_MIN_POLL_INTERVAL: 0.5}
+        )
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], options
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_poll_interval"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**options, CONF_MAX_POLL_INTERVAL: 120}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {
+        **options,
+        CONF_MAX_POLL_INTERVAL: 120,
+        CONF_EXTRA_SENSORS: [],
+    }
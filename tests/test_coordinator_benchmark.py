@@ -0,0 +1,245 @@
+"""Coordinator refresh latency and requests per poll."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.zte_wf830 import coordinator as coordinator_module
+from custom_components.zte_wf830.api import SNAPSHOT_NODES, LteBand, ZteCommands
+from custom_components.zte_wf830.coordinator import ZteDeviceUpdateCoordinator
+from custom_components.zte_wf830.retry import RebootPolicy, RetryPolicy
+
+from .mock_router import MockRouter
+
+LATENCY = 0.005
+
+
+@pytest.fixture
+def coordinator(
+    run, bare_hass, router: MockRouter, client
+) -> ZteDeviceUpdateCoordinator:
+    router.latency = LATENCY
+    coordinator = ZteDeviceUpdateCoordinator(bare_hass, client, 0.5, 5)
+    run(coordinator.async_refresh())
+    assert coordinator.last_update_success
+    router.reset_counters()
+    return coordinator
+
+
+@pytest.fixture
+def fast_band_changes(monkeypatch) -> None:
+    monkeypatch.setattr(coordinator_module, "BAND_CHANGE_DELAY", 0.05)
+    monkeypatch.setattr(coordinator_module, "BAND_CONFIRM_INTERVAL", 0.01)
+    monkeypatch.setattr(coordinator_module, "BAND_CONFIRM_TIMEOUT", 0.1)
+
+
+async def _wait_for_band_change(coordinator: ZteDeviceUpdateCoordinator) -> None:
+    """Wait until the requested band change was written and confirmed."""
+    await asyncio.sleep(2 * coordinator_module.BAND_CHANGE_DELAY)
+    async with coordinator.band_lock:
+        pass
+
+
+def test_full_refresh(benchmark, bench, router: MockRouter, coordinator) -> None:
+    """Every node due: the tick costs a single concurrent round-trip."""
+
+    def make_all_due() -> None:
+        coordinator.scheduler.reset([*SNAPSHOT_NODES, ZteCommands.LIST_FULL])
+
+    rounds = bench(coordinator.async_refresh, setup=make_all_due)
+
+    requests_per_poll = router.total_requests / rounds
+    benchmark.extra_info["requests_per_poll"] = requests_per_poll
+    assert requests_per_poll == 2
+    assert coordinator.last_update_success
+
+
+def test_full_refresh_with_extra_sensors(
+    benchmark, bench, run, bare_hass, router: MockRouter, client
+) -> None:
+    """Discovered nodes share the NODE_GET, each extra list adds a LIST_FULL."""
+    router.latency = LATENCY
+    coordinator = ZteDeviceUpdateCoordinator(
+        bare_hass, client, 0.5, 5, extra_sensors=["N_1_1", "2/1/L_2"]
+    )
+    router.nodes["N_1_1"] = "42;"
+    run(coordinator.async_refresh())
+    router.reset_counters()
+
+    def make_all_due() -> None:
+        coordinator.scheduler.reset(coordinator.scheduler.intervals())
+
+    rounds = bench(coordinator.async_refresh, setup=make_all_due)
+
+    requests_per_poll = router.total_requests / rounds
+    benchmark.extra_info["requests_per_poll"] = requests_per_poll
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == rounds
+    assert router.requests["OAM_MIDWARE_LIST_FULL"] == 2 * rounds
+    assert coordinator.node_value("N_1_1") == "42"
+    assert coordinator.list_item_value(2, 1, "L_2") == "192.168.1.1"
+
+
+def test_idle_refresh(benchmark, bench, router: MockRouter, coordinator) -> None:
+    """Nothing due yet: the tick is served from the last values seen."""
+    rounds = bench(coordinator.async_refresh)
+
+    benchmark.extra_info["requests_per_poll"] = router.total_requests / rounds
+    assert router.total_requests == 0
+    assert coordinator.data is not None
+
+
+def test_unchanged_refresh_reaches_entities(run, coordinator) -> None:
+    """Meters and histories advance on every tick, even if no value changed."""
+    updates = []
+    unsubscribe = coordinator.async_add_listener(lambda: updates.append(None))
+
+    for _ in range(2):
+        updates.clear()
+        run(coordinator.async_refresh())
+        assert updates
+
+    unsubscribe()
+
+
+def test_refresh_after_session_expiry(
+    bench, router: MockRouter, coordinator
+) -> None:
+    def expire() -> None:
+        router.expire_sessions()
+        coordinator.scheduler.reset([*SNAPSHOT_NODES, ZteCommands.LIST_FULL])
+
+    rounds = bench(coordinator.async_refresh, setup=expire)
+
+    assert router.requests["login"] == rounds
+    assert coordinator.last_update_success
+
+
+def test_reboot_recovery(
+    bench, run, bare_hass, router: MockRouter, client
+) -> None:
+    """Polls stop during the reboot and resume right after one login."""
+    router.latency = LATENCY
+    router.boot_time = 0.1
+    policy = RebootPolicy(
+        backoff=RetryPolicy(base_delay=0.01, max_delay=0.04),
+        shutdown_timeout=0.5,
+        timeout=5,
+    )
+    coordinator = ZteDeviceUpdateCoordinator(
+        bare_hass, client, 0.5, 5, reboot_policy=policy
+    )
+    run(coordinator.async_refresh())
+
+    async def reboot() -> None:
+        router.reset_counters()
+        await coordinator.async_reboot()
+        assert not coordinator.last_update_success
+
+        # polls while rebooting never reach the device
+        await coordinator.async_refresh()
+        assert router.requests["OAM_MIDWARE_NODE_GET"] == 0
+
+        while coordinator.rebooting or not coordinator.last_update_success:
+            await asyncio.sleep(0.005)
+
+    rounds = bench(reboot, rounds=5)
+
+    assert rounds
+    # sent once, though the router dropped the connection of the second write
+    assert router.requests["OAM_MIDWARE_NODE_SET"] == 2
+    assert router.requests["login"] == 1
+    assert router.requests["OAM_MIDWARE_NODE_GET"] == 1
+    # spaced out: far fewer probes than the boot time allows at 10 ms
+    assert router.requests["index"] < 10
+    assert coordinator.data is not None
+
+
+def test_band_change_is_confirmed(
+    run, router: MockRouter, coordinator, fast_band_changes
+) -> None:
+    async def change() -> None:
+        coordinator.async_request_bands([LteBand.BAND_7])
+        # shown before the write
+        assert coordinator.data.active_bands == [LteBand.BAND_7]
+        await _wait_for_band_change(coordinator)
+
+    run(change())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == 1
+    assert router.nodes["N_8_38"] == "7;"
+    assert coordinator.data.active_bands == [LteBand.BAND_7]
+
+
+def test_ignored_band_change_is_rolled_back(
+    run, router: MockRouter, coordinator, fast_band_changes
+) -> None:
+    router.ignore_writes = True
+
+    async def change() -> None:
+        coordinator.async_request_bands([LteBand.BAND_7])
+        assert coordinator.data.active_bands == [LteBand.BAND_7]
+        await _wait_for_band_change(coordinator)
+
+    run(change())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == 1
+    # confirmation polled until it timed out
+    assert router.requests["OAM_MIDWARE_NODE_GET"] > 2
+    assert coordinator.data.active_bands == [LteBand.BAND_1, LteBand.BAND_3]
+
+
+def test_superseded_band_change_is_dropped(
+    run, router: MockRouter, coordinator, fast_band_changes
+) -> None:
+    async def change() -> None:
+        coordinator.async_request_bands([LteBand.BAND_7])
+        coordinator.async_request_bands([LteBand.BAND_20])
+        assert coordinator.data.active_bands == [LteBand.BAND_20]
+        await _wait_for_band_change(coordinator)
+
+    run(change())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == 1
+    assert router.nodes["N_8_38"] == "20;"
+    assert coordinator.data.active_bands == [LteBand.BAND_20]
+
+
+def test_last_band_cannot_be_disabled(
+    run, router: MockRouter, coordinator, fast_band_changes
+) -> None:
+    async def disable_all() -> None:
+        coordinator.async_set_band_enabled(LteBand.BAND_1, False)
+        with pytest.raises(HomeAssistantError):
+            coordinator.async_set_band_enabled(LteBand.BAND_3, False)
+        await _wait_for_band_change(coordinator)
+
+    run(disable_all())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == 1
+    assert router.nodes["N_8_38"] == "3;"
+
+
+def test_band_toggles_are_merged(
+    run, router: MockRouter, coordinator, fast_band_changes
+) -> None:
+    """Toggles within BAND_CHANGE_DELAY end in one write of the selection."""
+
+    async def toggle() -> None:
+        coordinator.async_set_band_enabled(LteBand.BAND_7, True)
+        coordinator.async_set_band_enabled(LteBand.BAND_1, False)
+        coordinator.async_set_band_enabled(LteBand.BAND_20, True)
+        assert coordinator.data.active_bands == [
+            LteBand.BAND_3,
+            LteBand.BAND_7,
+            LteBand.BAND_20,
+        ]
+        await _wait_for_band_change(coordinator)
+
+    run(toggle())
+
+    assert router.requests["OAM_MIDWARE_NODEM_SET"] == 1
+    assert router.nodes["N_8_38"] == "3;7;20;"
@@ -0,0 +1,136 @@
+"""Polling several routers through one fleet scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from custom_components.zte_wf830.api import AsyncZteWf830ApiClient
+from custom_components.zte_wf830.coordinator import ZteDeviceUpdateCoordinator
+from custom_components.zte_wf830.fleet import FleetScheduler
+from custom_components.zte_wf830.retry import RetryPolicy
+
+from .mock_router import PASSWORD, MockRouter
+
+LATENCY = 0.005
+MAX_CONCURRENT = 4
+
+
+@pytest.fixture
+def make_fleet(run, bare_hass, socket_enabled):
+    """Start ``count`` routers, each polled by its own coordinator and session."""
+    routers: list[MockRouter] = []
+    sessions: list[aiohttp.ClientSession] = []
+
+    def make(count: int, fleet: FleetScheduler) -> list[ZteDeviceUpdateCoordinator]:
+        async def create() -> list[ZteDeviceUpdateCoordinator]:
+            coordinators = []
+            for _ in range(count):
+                router = MockRouter(latency=LATENCY)
+                await router.start()
+                routers.append(router)
+
+                session = aiohttp.ClientSession()
+                sessions.append(session)
+                client = AsyncZteWf830ApiClient(
+                    router.host,
+                    PASSWORD,
+                    session,
+                    retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.05),
+                )
+                await client.authenticate()
+                coordinators.append(
+                    ZteDeviceUpdateCoordinator(
+                        bare_hass, client, 0.5, 5, fleet=fleet
+                    )
+                )
+            return coordinators
+
+        return run(create())
+
+    yield make
+
+    async def stop() -> None:
+        for session in sessions:
+            await session.close()
+        for router in routers:
+            await router.stop()
+
+    run(stop())
+
+
+def _refresh_all(coordinators: list[ZteDeviceUpdateCoordinator]):
+    async def refresh() -> None:
+        for coordinator in coordinators:
+            coordinator.scheduler.reset(coordinator.scheduler.intervals())
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+        for coordinator in coordinators:
+            coordinator.fleet_member.cancel()
+
+    return refresh
+
+
+@pytest.mark.parametrize("count", [1, 4, 16])
+def test_fleet_refresh(benchmark, bench, make_fleet, count: int) -> None:
+    """Per-device poll time stays flat until the routers exceed the slots."""
+    fleet = FleetScheduler(max_concurrent=MAX_CONCURRENT, stagger_period=1)
+    coordinators = make_fleet(count, fleet)
+
+    bench(_refresh_all(coordinators), rounds=10)
+
+    durations = [c.poll_duration for c in coordinators]
+    benchmark.extra_info["mean_poll_duration"] = sum(
+        d.mean or 0 for d in durations
+    ) / len(durations)
+    assert all(c.last_update_success for c in coordinators)
+    assert len(fleet) == count
+
+
+def test_concurrent_polls_are_limited(run, make_fleet) -> None:
+    fleet = FleetScheduler(max_concurrent=2, stagger_period=1)
+    coordinators = make_fleet(6, fleet)
+
+    active = peak = 0
+
+    def track(coordinator: ZteDeviceUpdateCoordinator) -> None:
+        fetch = coordinator.api_client.fetch
+
+        async def tracked(batch):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                return await fetch(batch)
+            finally:
+                active -= 1
+
+        coordinator.api_client.fetch = tracked
+
+    for coordinator in coordinators:
+        track(coordinator)
+
+    run(_refresh_all(coordinators)())
+
+    assert peak == 2
+    assert all(c.last_update_success for c in coordinators)
+
+
+def test_polls_are_staggered(run, make_fleet) -> None:
+    fleet = FleetScheduler(stagger_period=1)
+    coordinators = make_fleet(4, fleet)
+    members = [c.fleet_member for c in coordinators]
+
+    phases = [fleet.phase(member) for member in members]
+    assert phases == [0, 0.25, 0.5, 0.75]
+
+    for member, phase in zip(members, phases):
+        when = fleet.align(member, 10.1)
+        assert when >= 10.1
+        assert when - 10.1 < 1
+        assert (when - phase) % 1 == pytest.approx(0, abs=1e-9)
+
+    run(coordinators[1].async_shutdown())
+    assert len(fleet) == 3
+    assert fleet.phase(members[2]) == pytest.approx(1 / 3)
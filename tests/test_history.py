@@ -0,0 +1,61 @@
+"""Signal metric history: ring buffer, window and percentiles."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.zte_wf830.history import MetricHistory, percentile
+
+
+def test_stats(benchmark) -> None:
+    history = MetricHistory(capacity=181, window=900)
+    for sample in range(181):
+        history.append(5.0 * sample, float(sample % 30))
+
+    def recompute():
+        history._stats_valid = False  # pylint: disable=protected-access
+        return history.stats()
+
+    stats = benchmark(recompute)
+
+    assert stats is not None
+    assert stats.count == 181
+
+
+def test_ring_wraps_around() -> None:
+    history = MetricHistory(capacity=3, window=100)
+
+    for second, value in enumerate([1.0, 2.0, 3.0, 4.0, 5.0]):
+        history.append(float(second), value)
+
+    assert len(history) == 3
+    assert history.values_since(0) == [3.0, 4.0, 5.0]
+
+
+def test_window_cutoff() -> None:
+    history = MetricHistory(capacity=10, window=10)
+    assert history.stats() is None
+
+    for second, value in [(0, -100.0), (5, 2.0), (10, 4.0), (15, 6.0)]:
+        history.append(float(second), value)
+
+    # the window ends at the latest sample, 15 s, and includes 5 s
+    stats = history.stats()
+    assert stats is not None
+    assert stats.count == 3
+    assert (stats.min, stats.max, stats.mean) == (2.0, 6.0, 4.0)
+
+    # cached until the next sample
+    assert history.stats() is stats
+    history.append(16.0, 8.0)
+    assert history.stats().count == 3
+
+
+def test_percentile_interpolates() -> None:
+    values = [10.0, 20.0, 30.0, 40.0, 50.0]
+
+    assert percentile(values, 0.0) == 10.0
+    assert percentile(values, 1.0) == 50.0
+    # position 0.4, between the first and the second value
+    assert percentile(values, 0.1) == pytest.approx(14.0)
+    assert percentile([7.0], 0.1) == 7.0
@@ -0,0 +1,70 @@
+"""Throughput of the ``_request.xml`` parsers."""
+
+from __future__ import annotations
+
+import xmltodict
+
+from custom_components.zte_wf830.api import (
+    E_UTRA_BANDS,
+    SNAPSHOT_NODES,
+    LteBand,
+    parse_active_bands,
+)
+from custom_components.zte_wf830.xml_parser import parse_lists, parse_node_values
+
+from .mock_router import DEFAULT_NODES
+
+NODE_GET_RESPONSE = (
+    "<?xml version='1.0' encoding='utf-8'?><data>"
+    + "".join(
+        f"<{node.value}>{DEFAULT_NODES[node.value]}</{node.value}>"
+        for node in SNAPSHOT_NODES
+    )
+    + "</data>"
+).encode()
+
+LIST_FULL_RESPONSE = (
+    b"<?xml version='1.0' encoding='utf-8'?><data>"
+    + b"<list><L_1>1234567890</L_1><L_5>987654321</L_5></list>" * 4
+    + b"</data>"
+)
+
+
+def test_parse_node_values(benchmark) -> None:
+    values = benchmark(parse_node_values, NODE_GET_RESPONSE)
+
+    assert values["N_8_38"] == "1;3"
+    assert len(values) == len(SNAPSHOT_NODES)
+
+
+def test_parse_node_values_xmltodict(benchmark) -> None:
+    """Baseline: the generic parser the fast path replaces."""
+    data = benchmark(xmltodict.parse, NODE_GET_RESPONSE)
+
+    assert len(data["data"]) == len(SNAPSHOT_NODES)
+
+
+def test_parse_lists(benchmark) -> None:
+    lists = benchmark(parse_lists, LIST_FULL_RESPONSE)
+
+    assert lists[0] == {"L_1": "1234567890", "L_5": "987654321"}
+
+
+ALL_BANDS_VALUE = "".join(f"{number};" for number in E_UTRA_BANDS)
+
+
+def test_decode_bands(benchmark) -> None:
+    bands = benchmark(parse_active_bands, ALL_BANDS_VALUE)
+
+    assert [band.number for band in bands] == list(E_UTRA_BANDS)
+
+
+def test_encode_bands(benchmark) -> None:
+    value = benchmark(LteBand.encode, list(reversed(LteBand)))
+
+    assert bytes.fromhex(value).decode("utf-16-be") == ALL_BANDS_VALUE
+
+
+def test_unknown_bands_are_skipped() -> None:
+    assert parse_active_bands("3;255;;20;") == [LteBand.BAND_3, LteBand.BAND_20]
+    assert parse_active_bands("") == []
@@ -0,0 +1,82 @@
+"""Throughput meter over synthetic counter samples."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.zte_wf830.rates import ThroughputMeter
+
+
+def test_update(benchmark) -> None:
+    samples = [(1000 * second, float(second)) for second in range(1000)]
+
+    def feed() -> ThroughputMeter:
+        meter = ThroughputMeter()
+        for total, now in samples:
+            meter.update(total, now)
+        return meter
+
+    meter = benchmark(feed)
+
+    assert meter.rate == 1000
+    assert meter.window_average == pytest.approx(1000)
+
+
+def test_rate_between_samples() -> None:
+    meter = ThroughputMeter()
+
+    meter.update(1000, 0.0)
+    assert meter.rate is None
+    assert meter.window_average is None
+
+    meter.update(3000, 4.0)
+    assert meter.rate == 500
+    assert meter.ewma == 500
+
+    # a repeated timestamp is ignored
+    meter.update(9000, 4.0)
+    assert meter.rate == 500
+
+
+def test_ewma_weight_depends_on_elapsed_time() -> None:
+    meter = ThroughputMeter(ewma_time_constant=10)
+
+    meter.update(0, 0.0)
+    meter.update(1000, 10.0)
+    meter.update(4000, 20.0)
+
+    alpha = 1 - math.exp(-1)
+    assert meter.rate == 300
+    assert meter.ewma == pytest.approx(100 + alpha * 200)
+
+
+def test_counter_reset_becomes_baseline() -> None:
+    meter = ThroughputMeter()
+
+    meter.update(10_000, 0.0)
+    meter.update(20_000, 10.0)
+    meter.update(500, 20.0)
+
+    assert meter.rate is None
+    assert meter.ewma is None
+    assert meter.window_average is None
+
+    meter.update(1500, 30.0)
+    assert meter.rate == 100
+    assert meter.ewma == 100
+
+
+def test_window_evicts_old_intervals() -> None:
+    meter = ThroughputMeter(window=30)
+
+    meter.update(0, 0.0)
+    meter.update(1000, 10.0)  # 100 bytes/s
+    meter.update(1000, 20.0)  # 0 bytes/s
+    meter.update(1000, 30.0)
+    assert meter.window_average == pytest.approx(1000 / 30)
+
+    # the interval ending at 10 s has left the window
+    meter.update(1600, 40.0)
+    assert meter.window_average == pytest.approx(600 / 30)
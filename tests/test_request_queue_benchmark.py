@@ -0,0 +1,87 @@
+"""Request queue: in-flight limit, write priority and superseded polls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.zte_wf830.api import AsyncZteWf830ApiClient, LteBand
+
+from .mock_router import MockRouter
+
+LATENCY = 0.005
+
+
+@pytest.fixture
+def client(run, router: MockRouter, make_client) -> AsyncZteWf830ApiClient:
+    router.latency = LATENCY
+    client = make_client(max_in_flight=1)
+    run(client.authenticate())
+    router.reset_counters()
+    return client
+
+
+def test_requests_are_serialized(run, router: MockRouter, make_client) -> None:
+    router.latency = LATENCY
+    client = make_client(max_in_flight=2)
+    run(client.authenticate())
+
+    async def poll() -> None:
+        await asyncio.gather(*(client.get_list(list_id) for list_id in range(6)))
+
+    run(poll())
+
+    assert router.requests["OAM_MIDWARE_LIST_FULL"] == 6
+    assert router.peak_concurrency == 2
+
+
+def test_write_jumps_ahead_of_polls(
+    benchmark, bench, router: MockRouter, client
+) -> None:
+    """Only the poll already in flight is answered before the write."""
+
+    async def poll_and_write() -> None:
+        router.reset_counters()
+        polls = [asyncio.create_task(client.get_list(list_id)) for list_id in range(5)]
+        await asyncio.sleep(0)
+        await client.set_bands([LteBand.BAND_3])
+        await asyncio.gather(*polls)
+
+    bench(poll_and_write)
+
+    assert router.log[:2] == [
+        "OAM_MIDWARE_LIST_FULL:0",
+        "OAM_MIDWARE_NODEM_SET:N_8_36",
+    ]
+    assert len(router.log) == 6
+
+
+def test_stale_polls_are_dropped(bench, router: MockRouter, client) -> None:
+    """Identical polls waiting for the same slot are sent once."""
+
+    async def poll() -> None:
+        await asyncio.gather(*(client.get_list(2) for _ in range(5)))
+
+    rounds = bench(poll)
+
+    # the first poll goes out at once, the other four wait and merge
+    assert router.requests["OAM_MIDWARE_LIST_FULL"] == 2 * rounds
+    assert client.metrics.superseded_requests == 3 * rounds
+
+
+def test_cancelled_poll_is_not_sent(run, router: MockRouter, client) -> None:
+    async def poll() -> None:
+        first = asyncio.create_task(client.get_list(0))
+        second = asyncio.create_task(client.get_list(2))
+        await asyncio.sleep(0)
+        assert client.request_queue.queued == 1
+        second.cancel()
+        await first
+        assert client.request_queue.queued == 0
+        await asyncio.sleep(LATENCY)
+
+    run(poll())
+
+    assert router.log == ["OAM_MIDWARE_LIST_FULL:0"]
+    assert client.request_queue.in_flight == 0
@@ -0,0 +1,100 @@
+"""Setting up a config entry against the mock router."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.zte_wf830.const import DOMAIN
+from custom_components.zte_wf830.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .mock_router import PASSWORD, MockRouter
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+BAND_1_SWITCH = "switch.zte_wf830_zte0123456789_band_1"
+
+
+async def test_entities_before_first_refresh(
+    hass: HomeAssistant, hass_router: MockRouter, config_entry: MockConfigEntry
+) -> None:
+    """Setup finishes before the first poll, whatever the router's latency."""
+    hass_router.latency = 0.5
+
+    started = time.monotonic()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    assert time.monotonic() - started < hass_router.latency
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert coordinator.data is None
+    switch = hass.states.get(BAND_1_SWITCH)
+    assert switch is not None
+    assert switch.state == STATE_UNKNOWN
+
+    while coordinator.data is None:
+        await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+    assert hass.states.get(BAND_1_SWITCH).state == "on"
+
+
+async def test_unreachable_router(
+    hass: HomeAssistant, hass_router: MockRouter, config_entry: MockConfigEntry
+) -> None:
+    await hass_router.stop()
+
+    assert not await hass.config_entries.async_setup(config_entry.entry_id)
+
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_bad_password_asks_again(
+    hass: HomeAssistant, hass_router: MockRouter, config_entry: MockConfigEntry
+) -> None:
+    hass.config_entries.async_update_entry(
+        config_entry, data={**config_entry.data, "smartadmin_password": "wrong"}
+    )
+
+    assert not await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.SETUP_ERROR
+    (flow,) = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert flow["context"]["source"] == SOURCE_REAUTH
+    assert flow["step_id"] == "reauth_confirm"
+
+    result = await hass.config_entries.flow.async_configure(
+        flow["flow_id"], {"smartadmin_password": PASSWORD}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert config_entry.state is ConfigEntryState.LOADED
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_router: MockRouter, config_entry: MockConfigEntry
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    while coordinator.data is None:
+        await asyncio.sleep(0.01)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["entry"]["data"]["smartadmin_password"] == REDACTED
+    assert diagnostics["client"]["in_flight_requests"] >= 0
+    assert diagnostics["client"]["queued_requests"] >= 0
+    assert diagnostics["client"]["requests"] > 0